@@ -97,9 +97,12 @@ class ChatBot(BotSettingsMixin, BotSetupMixin, PartnershipActionsMixin, Autonomo
         start_bot: Start the bot.
         pause_bot: Pause the bot.
         resume_bot: Resume the bot.
+        _check_existing_partnership: Look for an open partnership on screen.
         stop_bot: Stop the bot.
         _run_async_wrapper: Run async wrapper.
         _bot_loop: Main bot loop.
+        _ui_command_pump: Run commands queued from the UI.
+        submit_ui_command: Queue a UI command for the bot loop.
         _main_loop: Main processing loop.
     """
 
@@ -137,6 +140,8 @@ class ChatBot(BotSettingsMixin, BotSetupMixin, PartnershipActionsMixin, Autonomo
         self.current_temp_window = None  # Current temporary message window
         self.ocr_language = ocr_language
         self.loop = None  # Asyncio event loop object
+        self._ui_cmd_queue = None  # Commands submitted from the UI thread
+        self._ui_cmd_tasks = set()  # Strong refs to running UI command tasks
 
         # Language switching state
         self.lang_consistency_counter = 0
@@ -148,6 +153,7 @@ class ChatBot(BotSettingsMixin, BotSetupMixin, PartnershipActionsMixin, Autonomo
         self.character_manifest = ""
         self.character_greeting = ""
         self.use_translation_layer = False
+        self.hooker_mod_enabled = False
         self._load_hotkey_settings()
 
         # Set path to Tesseract executable
@@ -314,7 +320,16 @@ class ChatBot(BotSettingsMixin, BotSetupMixin, PartnershipActionsMixin, Autonomo
             self.log("Scanning started.", internal=True)
             self.ui.update_status("Running")
         self.ui.update_buttons_state(True, paused=False)
-        # Check for existing partnership when starting scanning
+        # Check for existing partnership when starting scanning; the screen
+        # search takes a screenshot, so keep it off the calling (Tk) thread
+        threading.Thread(target=self._check_existing_partnership, daemon=True).start()
+
+    def _check_existing_partnership(self):
+        """
+        Look for the close partnership button on screen.
+
+        Runs on a worker thread; sets partnership_active when the button is found.
+        """
         if os.path.exists(CLOSE_BTN_IMAGE_PATH):
             try:
                 search_area = self.areas.get('close_partnership_btn')
@@ -438,7 +453,7 @@ class ChatBot(BotSettingsMixin, BotSetupMixin, PartnershipActionsMixin, Autonomo
                     self.use_translation_layer = True
                     if hasattr(self.ui, 'use_translation_var'):
                         self.ui.use_translation_var.set(True)
-                        self.ui.root.after(0, self.ui.update_switch_colors)
+                        self.ui.root.after_idle(self.ui.update_switch_colors)
                     self.log(f"Auto-enabling translation layer for {detected_lang}.", internal=True)
                 
                 # Update OCR language dynamically
@@ -467,7 +482,7 @@ class ChatBot(BotSettingsMixin, BotSetupMixin, PartnershipActionsMixin, Autonomo
             self.use_translation_layer = True
             if hasattr(self, 'ui') and self.ui:
                 self.ui.use_translation_var.set(True)
-                self.ui.root.after(0, self.ui.update_switch_colors)
+                self.ui.root.after_idle(self.ui.update_switch_colors)
             self.log(f"Auto-enabling translation layer for {self.current_language}.", internal=True)
 
     async def get_translated_response(self, message, author=None):
@@ -507,6 +522,8 @@ class ChatBot(BotSettingsMixin, BotSetupMixin, PartnershipActionsMixin, Autonomo
         Initializes processor and runs the main processing loop.
         """
         self.chat_processor = ChatProcessor(self.ignore_nicks, self.target_nicks, self.log, self.ocr_language)
+        self._ui_cmd_queue = asyncio.Queue()
+        pump = asyncio.create_task(self._ui_command_pump())
 
         while self.bot_running:
             try:
@@ -522,8 +539,42 @@ class ChatBot(BotSettingsMixin, BotSetupMixin, PartnershipActionsMixin, Autonomo
                 self.log(traceback.format_exc(), internal=True)
                 await asyncio.sleep(5)  # Pause before recovery attempt
 
+        pump.cancel()
+        self._ui_cmd_queue = None
         self.log("Bot loop finished.", internal=True)
 
+    async def _ui_command_pump(self):
+        """
+        Consume commands submitted from the UI thread.
+
+        Each queued item is a zero-argument callable returning a coroutine,
+        which is scheduled as a task on the bot loop.
+        """
+        while True:
+            coro_fn = await self._ui_cmd_queue.get()
+            task = asyncio.create_task(coro_fn())
+            self._ui_cmd_tasks.add(task)
+            task.add_done_callback(self._ui_cmd_tasks.discard)
+
+    def submit_ui_command(self, coro_fn):
+        """
+        Queue a coroutine function for execution on the bot loop.
+
+        Thread-safe; avoids allocating a concurrent Future per call the way
+        asyncio.run_coroutine_threadsafe does.
+
+        Args:
+            coro_fn: Zero-argument callable returning a coroutine.
+
+        Returns:
+            bool: True if the command was queued, False if the loop is not running.
+        """
+        queue = self._ui_cmd_queue
+        if self.loop is None or queue is None:
+            return False
+        self.loop.call_soon_threadsafe(queue.put_nowait, coro_fn)
+        return True
+
     async def _main_loop(self):
         """
         Main processing loop.
@@ -12,8 +12,12 @@ Classes:
 
 import json
 import os
+import threading
 from .config import (SETTINGS_FILE, HOTKEY_PHRASES_FILE)
 
+# Serializes settings writes from the UI, bot and background save threads
+_SETTINGS_LOCK = threading.Lock()
+
 
 class BotSettingsMixin:
     """
@@ -379,8 +383,13 @@ class BotSettingsMixin:
                 "active_character_name": getattr(self, 'active_character_name', None)
             }
             os.makedirs(os.path.dirname(SETTINGS_FILE), exist_ok=True)
-            with open(SETTINGS_FILE, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, indent=2, ensure_ascii=False)
+            # Write a temp file and swap it in, so an interrupted write never
+            # leaves a truncated settings file
+            tmp_file = SETTINGS_FILE + '.tmp'
+            with _SETTINGS_LOCK:
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    json.dump(settings, f, indent=2, ensure_ascii=False)
+                os.replace(tmp_file, SETTINGS_FILE)
             self.log("Settings saved.", internal=True)
         except Exception as e:
             self.log(f"Error saving settings: {e}", internal=True)
@@ -476,7 +485,7 @@ class BotSettingsMixin:
             self.use_translation_layer = True
             if hasattr(self, 'ui') and self.ui:
                 self.ui.use_translation_var.set(True)
-                self.ui.root.after(0, self.ui.update_switch_colors)
+                self.ui.root.after_idle(self.ui.update_switch_colors)
             self.log(f"Auto-enabling translation layer for {language}.", internal=True)
 
         self.save_settings()
@@ -9,6 +9,7 @@ Classes:
 """
 
 import asyncio
+from functools import partial
 import pyautogui
 import pyperclip
 import time
@@ -125,9 +126,8 @@ class ChatActionsMixin:
         Args:
             key (str): The hotkey identifier.
         """
-        if self.bot_running and not self.paused and self.loop:
-            asyncio.run_coroutine_threadsafe(self._async_initiate_chat(key), self.loop)
-        else:
+        queued = self.bot_running and not self.paused and self.submit_ui_command(partial(self._async_initiate_chat, key))
+        if not queued:
             self.log("Cannot initiate chat: bot not running or paused.", internal=True)
 
     async def _async_initiate_chat(self, key):
@@ -178,9 +178,8 @@ class ChatActionsMixin:
         Args:
             message (str): The text message to process.
         """
-        if self.bot_running and not self.paused and self.loop:
-            asyncio.run_coroutine_threadsafe(self._async_initiate_chat_from_text(message), self.loop)
-        else:
+        queued = self.bot_running and not self.paused and self.submit_ui_command(partial(self._async_initiate_chat_from_text, message))
+        if not queued:
             self.log("Cannot initiate chat: bot not running or paused.", internal=True)
 
     async def _async_initiate_chat_from_text(self, message):
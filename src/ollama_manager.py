@@ -62,6 +62,8 @@ class OllamaManager:
         # Threading for async operations
         self._service_thread = None
         self._stop_service_event = threading.Event()
+        # Set on shutdown so a detection still in flight publishes nothing
+        self._detect_cancel = threading.Event()
         
         # Chat context history
         self.chat_history = []
@@ -73,16 +75,22 @@ class OllamaManager:
         Returns:
             bool: True if Ollama is detected, False otherwise.
         """
+        if self._detect_cancel.is_set():
+            return False
         try:
-            self.status_manager.set_ollama_status("Checking")
-            
-            # Check if executable exists
+            # Check if executable exists; no service probe (and no interim
+            # "Checking" status) is needed when it does not
             if not self.file_manager.ollama_exists():
                 self.status_manager.set_ollama_status("Not Installed")
                 return False
-            
+
+            self.status_manager.set_ollama_status("Checking")
+
             # Check if service is running
-            if self.is_service_running():
+            running = self.is_service_running()
+            if self._detect_cancel.is_set():
+                return False
+            if running:
                 # For diagnostic purposes: if we are on the isolated port but didn't open logs yet,
                 # we might want to suggest a restart or just log it.
                 if not hasattr(self, 'server_log_file') or not self.server_log_file:
@@ -100,6 +108,15 @@ class OllamaManager:
             self.status_manager.set_ollama_status("Error")
             return False
     
+    def cancel_detection(self):
+        """
+        Stop detect_ollama from publishing further status changes.
+
+        Used on shutdown, when a detection thread may still be waiting on
+        the service probe after the UI is gone.
+        """
+        self._detect_cancel.set()
+
     def download_ollama(self, progress_callback: Optional[Callable] = None, complete_callback: Optional[Callable] = None):
         """
         Download Ollama executable.
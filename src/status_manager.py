@@ -242,8 +242,8 @@ class StatusManager:
         """Background monitoring loop."""
         while self._monitoring and not self._stop_monitoring.is_set():
             try:
-                # Update status every 5 seconds
-                time.sleep(5)
+                # Update status every 5 seconds; stop_monitoring wakes the wait
+                self._stop_monitoring.wait(5)
                 
                 # This would be called by the OllamaManager
                 # when status changes occur
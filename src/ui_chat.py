@@ -27,13 +27,15 @@ class UIChatMixin:
         for widget in self.chat_frame.winfo_children():
             widget.destroy()
 
+        MD, XXL = UIStyles.SPACE_MD, UIStyles.SPACE_2XL
+
         # Page container
         self.chat_frame.columnconfigure(0, weight=1)
         self.chat_frame.rowconfigure(1, weight=1)
 
         # 1. Header with Tools
         header = ctk.CTkFrame(self.chat_frame, fg_color="transparent")
-        header.grid(row=0, column=0, sticky="ew", padx=UIStyles.SPACE_2XL, pady=(UIStyles.SPACE_2XL, UIStyles.SPACE_MD))
+        header.grid(row=0, column=0, sticky="ew", padx=XXL, pady=(XXL, MD))
         header.columnconfigure(0, weight=1)
 
         self.chat_title_label = ctk.CTkLabel(header, text="Chat Room", 
@@ -65,7 +67,7 @@ class UIChatMixin:
         # 2. Chat History Area
         # We use a non-scrollable character_frame at the top level, but THIS card is scrollable for messages
         chat_card = UIStyles.create_card_frame(self.chat_frame)
-        chat_card.grid(row=1, column=0, sticky="nsew", padx=UIStyles.SPACE_2XL, pady=UIStyles.SPACE_MD)
+        chat_card.grid(row=1, column=0, sticky="nsew", padx=XXL, pady=MD)
         chat_card.columnconfigure(0, weight=1)
         chat_card.rowconfigure(0, weight=1)
 
@@ -74,7 +76,7 @@ class UIChatMixin:
 
         # 3. Input Area
         input_panel = ctk.CTkFrame(self.chat_frame, fg_color="transparent")
-        input_panel.grid(row=2, column=0, sticky="ew", padx=UIStyles.SPACE_2XL, pady=(UIStyles.SPACE_MD, UIStyles.SPACE_2XL))
+        input_panel.grid(row=2, column=0, sticky="ew", padx=XXL, pady=(MD, XXL))
         input_panel.columnconfigure(0, weight=1)
 
         self.chat_entry = UIStyles.create_input_field(input_panel, textvariable=self.chat_input_var, 
@@ -9,8 +9,18 @@ Classes:
     UIHandlersMixin: Mixin class for UI event handling.
 """
 
-import tkinter as tk
-import traceback
+from .ui_styles import UIStyles
+
+# Collapse button glyphs
+_ARROW_UP = "▲"
+_ARROW_DN = "▼"
+
+# Lock keys for the language hotkeys, built once instead of per keypress
+_LANG_LOCK_KEYS = {lang: f'change_{lang}' for lang in ('en', 'ru', 'fr', 'es')}
+
+# Switch colors for the on/off states, built once
+_SWITCH_ON = {'fg_color': UIStyles.HOVER_COLOR, 'progress_color': UIStyles.HOVER_COLOR}
+_SWITCH_OFF = {'fg_color': UIStyles.DISABLED_COLOR, 'progress_color': UIStyles.DISABLED_COLOR}
 
 
 class UIHandlersMixin:
@@ -33,12 +43,15 @@ class UIHandlersMixin:
         on_manual_send_click: Handle manual send button click.
         on_toggle_overlay: Handle overlay toggle.
         on_autonomous_toggle: Handle autonomous mode toggle.
+        _flush_autonomous_save: Persist autonomous mode after debouncing.
         toggle_window_visibility: Toggle window visibility.
+        _toggle_section: Toggle a collapsible section.
         toggle_nicks_collapse: Toggle nick lists section visibility.
         toggle_logs_collapse: Toggle logs section visibility.
-        on_translation_toggle: Handle translation toggle.
         on_language_selected: Handle language selection from dropdown.
         update_switch_colors: Update switch colors based on state.
+        _schedule_switch_refresh: Coalesce switch color updates to idle time.
+        _do_switch_refresh: Run the scheduled switch color refresh.
     """
 
     def on_start_click(self):
@@ -47,14 +60,13 @@ class UIHandlersMixin:
 
         Starts the bot if it exists and is not already running.
         """
-        if hasattr(self, 'ollama_manager') and hasattr(self, 'status_manager'):
-            status = self.status_manager.get_ollama_status()
-            if status == "Running":
-                import threading
-                threading.Thread(target=self.ollama_manager.stop_service, daemon=True).start()
-            else:
-                import threading
-                threading.Thread(target=self.ollama_manager.start_service, daemon=True).start()
+        status = self.status_manager.get_ollama_status()
+        if status == "Running":
+            import threading
+            threading.Thread(target=self.ollama_manager.stop_service, daemon=True).start()
+        else:
+            import threading
+            threading.Thread(target=self.ollama_manager.start_service, daemon=True).start()
 
     def on_pause_click(self):
         """
@@ -84,8 +96,6 @@ class UIHandlersMixin:
             running (bool): Whether the bot is currently running.
             paused (bool): Whether the bot is currently paused.
         """
-        from .ui_styles import UIStyles
-        
         # Start button - Success green when available
         # Start button - Handled via Ollama status callback (_on_ollama_status_changed in ui_main.py)
         # We comment out the standard state management to let the callback handle it exclusively
@@ -121,7 +131,11 @@ class UIHandlersMixin:
         Gets the selected language from the UI variable and triggers language change.
         """
         language = self.hiwaifu_language_var.get()
-        self.on_change_language_click(language)
+        handler = self._lang_handlers.get(language)
+        if handler:
+            handler()
+        else:
+            self.on_change_language_click(language)
 
     def on_clear_chat_click(self):
         """
@@ -146,10 +160,7 @@ class UIHandlersMixin:
         try:
             if self.bot:
                 if self.bot.partnership_active:
-                    import asyncio
-                    if self.bot.loop:
-                        asyncio.run_coroutine_threadsafe(self.bot._close_partnership(), self.bot.loop)
-                    else:
+                    if not self.bot.submit_ui_command(self.bot._close_partnership):
                         self.bot.log("Bot not running, cannot close partnership.", internal=True)
                 else:
                     self.bot.log("Partnership not active, nothing to close.", internal=True)
@@ -165,7 +176,7 @@ class UIHandlersMixin:
         Args:
             language (str): The language code to change to.
         """
-        key = f'change_{language}'
+        key = _LANG_LOCK_KEYS.get(language) or f'change_{language}'
         if self._check_lock(key, full_lock=True):
             return
         try:
@@ -191,11 +202,11 @@ class UIHandlersMixin:
             self.bot.toggle_overlay()
             # Sync variable
             self.show_zones_var.set(self.bot.show_overlay)
-            self.update_switch_colors()
+            self._schedule_switch_refresh()
 
-            # Refresh game sync view if open to update button text
-            if self.current_view == 'game_sync' and hasattr(self, '_populate_game_sync_view'):
-                self.show_game_sync_view()
+            # Update the Game Sync overlay button text if that view was built
+            if self._game_sync_overlay_btn is not None:
+                self._game_sync_overlay_btn.configure(text="Hide Zones" if self.bot.show_overlay else "Show Zones")
 
     def on_autonomous_toggle(self):
         """
@@ -205,16 +216,21 @@ class UIHandlersMixin:
         """
         if self.bot:
             self.bot.autonomous_mode = self.autonomous_var.get()
-            self.bot.save_settings()
-            self.bot.log(f"Autonomous mode {'enabled' if self.bot.autonomous_mode else 'disabled'}.", internal=True)
+            # Coalesce rapid toggles into a single settings write
+            if self._pending_save:
+                self.root.after_cancel(self._pending_save)
+            self._pending_save = self.root.after(100, self._flush_autonomous_save)
 
-        # Update switch colors
-        from .ui_styles import UIStyles
-        if self.autonomous_var.get():
-            self.auto_mode_switch.configure(fg_color=UIStyles.HOVER_COLOR, progress_color=UIStyles.HOVER_COLOR)
-        else:
-            self.auto_mode_switch.configure(fg_color=UIStyles.DISABLED_COLOR, progress_color=UIStyles.DISABLED_COLOR)
+        self._schedule_switch_refresh()
 
+    def _flush_autonomous_save(self):
+        """
+        Persist autonomous mode once a burst of toggles has settled.
+        """
+        self._pending_save = None
+        if self.bot:
+            self.bot.save_settings()
+            self.bot.log(f"Autonomous mode {'enabled' if self.bot.autonomous_mode else 'disabled'}.", internal=True)
 
     def toggle_window_visibility(self):
         """
@@ -228,44 +244,38 @@ class UIHandlersMixin:
         else:
             self.root.iconify()
 
-    def toggle_nicks_collapse(self):
-        """Toggle nick lists section visibility."""
-        if not hasattr(self, 'nicks_content_frame'):
+    def _toggle_section(self, frame_attr, btn_attr, flag_attr):
+        """
+        Toggle visibility of a collapsible section.
+
+        Args:
+            frame_attr (str): Attribute name of the content frame.
+            btn_attr (str): Attribute name of the collapse button.
+            flag_attr (str): Attribute name of the collapsed flag.
+        """
+        frame = getattr(self, frame_attr, None)
+        if frame is None:
             return
-            
-        if self.nicks_collapsed:
-            self.nicks_content_frame.grid()
-            self.nicks_collapse_btn.configure(text="▲")
-            self.nicks_collapsed = False
+
+        btn = getattr(self, btn_attr)
+        collapsed = getattr(self, flag_attr)
+        if collapsed:
+            frame.grid()
+            btn.configure(text=_ARROW_UP)
         else:
-            self.nicks_content_frame.grid_remove()
-            self.nicks_collapse_btn.configure(text="▼")
-            self.nicks_collapsed = True
+            frame.grid_remove()
+            btn.configure(text=_ARROW_DN)
+        setattr(self, flag_attr, not collapsed)
+
+    def toggle_nicks_collapse(self):
+        """Toggle nick lists section visibility."""
+        if not self._nicks_built and self.nicks_content_frame is not None:
+            self._build_nick_cards()
+        self._toggle_section('nicks_content_frame', 'nicks_collapse_btn', 'nicks_collapsed')
 
     def toggle_logs_collapse(self):
         """Toggle logs section visibility."""
-        if not hasattr(self, 'logs_content_frame'):
-            return
-            
-        if self.logs_collapsed:
-            self.logs_content_frame.grid()
-            self.logs_collapse_btn.configure(text="▲")
-            self.logs_collapsed = False
-        else:
-            self.logs_content_frame.grid_remove()
-            self.logs_collapse_btn.configure(text="▼")
-            self.logs_collapsed = True
-
-    def on_translation_toggle(self):
-        """
-        Handle translation toggle.
-        """
-        if self.bot:
-            self.bot.use_translation_layer = self.use_translation_var.get()
-            self.bot._save_hotkey_settings() # Save selection
-            self.bot.log(f"Translation layer {'enabled' if self.bot.use_translation_layer else 'disabled'}.", internal=True)
-        
-        self.update_switch_colors()
+        self._toggle_section('logs_content_frame', 'logs_collapse_btn', 'logs_collapsed')
 
     def on_language_selected(self, language):
         """
@@ -279,18 +289,37 @@ class UIHandlersMixin:
         """
         Update switch colors based on state.
         """
-        from .ui_styles import UIStyles
-        
         # Mapping of variables to switches
-        switches = [
+        switches = (
             (self.use_translation_var, self.translation_layer_switch),
             (self.autonomous_var, self.auto_mode_switch),
             (self.hooker_enabled_var, self.hooker_switch),
             (self.show_zones_var, self.show_zones_switch)
-        ]
-        
+        )
+
+        # Only reconfigure switches whose state differs from the last applied one
+        states = self._switch_states
         for var, sw in switches:
-            if var.get():
-                sw.configure(fg_color=UIStyles.HOVER_COLOR, progress_color=UIStyles.HOVER_COLOR)
-            else:
-                sw.configure(fg_color=UIStyles.DISABLED_COLOR, progress_color=UIStyles.DISABLED_COLOR)
+            on = bool(var.get())
+            if states.get(sw) is not on:
+                sw.configure(**(_SWITCH_ON if on else _SWITCH_OFF))
+                states[sw] = on
+
+    def _schedule_switch_refresh(self):
+        """
+        Schedule a single switch color refresh for the current event cycle.
+
+        Several toggles handled in one Tk event cycle collapse into one
+        update_switch_colors pass.
+        """
+        if self._switch_refresh_pending:
+            return
+        self._switch_refresh_pending = True
+        self.root.after_idle(self._do_switch_refresh)
+
+    def _do_switch_refresh(self):
+        """
+        Run the scheduled switch color refresh.
+        """
+        self._switch_refresh_pending = False
+        self.update_switch_colors()
@@ -21,8 +21,12 @@ Classes:
 
 import time
 import traceback
+from functools import partial
 import keyboard
 
+# Language-switch hotkeys -> language code
+_LANGUAGE_HOTKEYS = {'ctrl+e': 'en', 'ctrl+r': 'ru', 'ctrl+f': 'fr', 'ctrl+s': 'es'}
+
 
 class HotkeyMixin:
     """
@@ -33,11 +37,11 @@ class HotkeyMixin:
     It ensures proper debouncing and processing locks for UI responsiveness.
 
     Attributes:
-        hotkey_locks (dict): Dictionary tracking key lock timestamps.
-        is_processing (dict): Dictionary tracking keys currently being processed.
+        hotkey_locks (dict): Packed per-key state: last press time (ns) and processing bit.
 
     Methods:
         setup_hotkeys: Set up all global hotkeys.
+        _log_hotkey_error: Log a deferred hotkey setup failure.
         _check_lock: Check if a key is locked or processing.
         _unlock: Unlock a key after processing.
         on_f2_press: Handle F2 key press.
@@ -51,28 +55,49 @@ class HotkeyMixin:
         Registers hotkeys for bot control, language switching, chat initiation,
         and window management. Includes debouncing and error handling.
         """
+        # The keyboard hook fires on its own thread; every handler is marshalled
+        # onto the Tk event loop via root.after so widgets are only touched there.
+        # The hook itself stays because the hotkeys must work while the game has focus.
+        after = self.root.after
+        # Language handlers are built once and shared with the language dropdown
+        self._lang_handlers = {lang: partial(self.on_change_language_click, lang)
+                               for lang in _LANGUAGE_HOTKEYS.values()}
         try:
-            keyboard.add_hotkey('f2', self.on_f2_press)
-            keyboard.add_hotkey('f3', self.toggle_window_visibility)
-            keyboard.add_hotkey('f4', self.on_clear_chat_click)
-            keyboard.add_hotkey('ctrl+e', lambda: self.on_change_language_click('en'))
-            keyboard.add_hotkey('ctrl+r', lambda: self.on_change_language_click('ru'))
-            keyboard.add_hotkey('ctrl+f', lambda: self.on_change_language_click('fr'))
-            keyboard.add_hotkey('ctrl+s', lambda: self.on_change_language_click('es'))
+            keyboard.add_hotkey('f2', after, args=(0, self.on_f2_press))
+            keyboard.add_hotkey('f3', after, args=(0, self.toggle_window_visibility))
+            keyboard.add_hotkey('f4', after, args=(0, self.on_clear_chat_click))
+
+            for hotkey, lang in _LANGUAGE_HOTKEYS.items():
+                keyboard.add_hotkey(hotkey, after, args=(0, self._lang_handlers[lang]))
 
             for i in range(5, 13):
                 key = f'f{i}'
-                keyboard.add_hotkey(key, lambda k=key: self.on_hotkey_initiate_chat(k.upper()))
+                keyboard.add_hotkey(key, after, args=(0, self.on_hotkey_initiate_chat, key.upper()))
+
+            # Defer logging so the first paint is not blocked by a Text insert
+            self.root.after_idle(self.log_message, "Global hotkeys (F2-F4, F5-F12, Ctrl+E/R/F/S) active.", True)
+        except Exception as e:
+            self.root.after_idle(self._log_hotkey_error, e)
+
+    def _log_hotkey_error(self, exc):
+        """
+        Log a hotkey setup failure with its traceback.
+
+        Formatting is deferred to idle time together with the log insert.
 
-            self.log_message("Global hotkeys (F2-F4, F5-F12, Ctrl+E/R/F/S) active.", internal=True)
-        except Exception:
-            self.log_message(f"Error setting up hotkeys: {traceback.format_exc()}", internal=True)
+        Args:
+            exc (Exception): The exception raised during hotkey setup.
+        """
+        details = "".join(traceback.format_exception(type(exc), exc, exc.__traceback__))
+        self.log_message(f"Error setting up hotkeys: {details}", internal=True)
 
     def _check_lock(self, key, debounce_time=0.5, full_lock=False):
         """
         Check if a key is locked or processing.
 
         Prevents rapid key presses and ensures proper sequencing of operations.
+        Each key's state is a single int, ``(timestamp_ns << 1) | processing_bit``,
+        so a check-and-set is one dict read and one dict write (atomic under the GIL).
 
         Args:
             key (str): The key to check.
@@ -82,14 +107,13 @@ class HotkeyMixin:
         Returns:
             bool: True if key is locked, False otherwise.
         """
-        current_time = time.time()
-        if key in self.hotkey_locks and current_time - self.hotkey_locks[key] < debounce_time:
+        now = time.monotonic_ns()
+        state = self.hotkey_locks.get(key, 0)
+        if state and now - (state >> 1) < int(debounce_time * 1_000_000_000):
             return True
-        if full_lock and key in self.is_processing and self.is_processing[key]:
+        if full_lock and state & 1:
             return True
-        self.hotkey_locks[key] = current_time
-        if full_lock:
-            self.is_processing[key] = True
+        self.hotkey_locks[key] = (now << 1) | (1 if full_lock else state & 1)
         return False
 
     def _unlock(self, key):
@@ -99,8 +123,9 @@ class HotkeyMixin:
         Args:
             key (str): The key to unlock.
         """
-        if key in self.is_processing:
-            self.is_processing[key] = False
+        state = self.hotkey_locks.get(key)
+        if state:
+            self.hotkey_locks[key] = state & ~1
 
     def on_f2_press(self):
         """
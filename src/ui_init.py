@@ -12,9 +12,59 @@ Classes:
 
 import tkinter as tk
 import customtkinter as ctk
+import collections
 import os
 from .ui_styles import UIStyles
 from .ui_character import UICharacterMixin
+from .ui_widgets import VirtualListbox
+
+# Static page text, built once at import
+_HELP_INSTRUCTIONS_TEXT = """1. Screen Area Setup:
+   - Click the "Configure Zones" button in Game Sync.
+   - Follow instructions to select areas: chat, input field, partnership, and poses.
+   - This is necessary for the bot to work correctly.
+
+2. Starting the Bot:
+   - Click "Start" to launch the bot.
+   - Press F2 to begin chat scanning.
+   - The bot will automatically respond to tracked nicks.
+
+3. Nick Management:
+   - Ignored: Messages from these nicks are ignored.
+   - Tracked: The bot responds to messages from these nicks.
+   - New nicks appear in the "Found" list.
+
+4. Autonomous Mode:
+   - Enable "Auto-mode" for automatic pose/partnership scanning.
+   - Set your preferred inactivity timeout.
+
+5. Pose Management:
+   - Unknown poses trigger a customizable message.
+   - Users can provide descriptions that get saved.
+   - Customize messages for different languages in Prompts.
+
+6. Manual Sending:
+   - Enter text in the bottom field and press "Send" or Enter."""
+
+_HELP_HOTKEYS_TEXT = """F2: Pause/Resume chat scanning
+F3: Show/Hide window
+F4: Clear chat history in HiWaifu
+F5-F12: Send preset phrases (configured in Prompts)
+
+Ctrl+E: Change HiWaifu language to English
+Ctrl+R: Change language to Russian
+Ctrl+F: Change language to French
+Ctrl+S: Change language to Spanish"""
+
+_AI_SETUP_FALLBACK_TEXT = """Configure AI model settings and parameters here.
+
+This section allows you to:
+- Select AI model and provider
+- Set temperature and other generation parameters
+- Configure API endpoints
+- Set up model-specific options
+
+Note: This feature is under development."""
 
 
 class UIInitMixin:
@@ -32,15 +82,56 @@ class UIInitMixin:
         setup_main_container: Setup main content container.
         setup_logs_frame: Setup logs display frame.
         setup_sidebar_frame: Setup sidebar with nick lists.
+        _add_toggle: Add a labelled sidebar switch.
+        _build_nick_cards: Build the nick list cards on first expand.
         setup_footer_frame: Setup footer with manual input and settings.
         setup_ui: Setup the main UI layout.
         update_header_layout: Adaptive grid layout for header buttons.
         update_footer_layout: Adaptive layout for footer.
         on_resize: Handle window resize event.
+        _do_resize: Apply layouts after a debounced resize.
+        _root_size: Return the cached root window size.
         rebuild_ui: Rebuild the UI based on view mode.
         on_auto_lang_toggle: Handle auto language switch toggle.
+        _make_toggle: Build a sidebar switch handler for a bot setting.
+        _switch_view: Make a view current and show it.
+        _show_view: Show a view by name.
+        _show_lazy_view: Show a secondary view, building it on first use.
+        _get_or_build: Return a cached view frame, building it once.
+        _build_view_frame: Create and populate a view frame.
+        _populate_in_chunks: Build part of a view now, the rest on later ticks.
+        _drain_populate_queue: Run the next batch of deferred build steps.
+        _raise_view: Raise a view frame unless it is already active.
     """
 
+    # Deferred view build steps run per event-loop tick
+    POPULATE_BATCH = 1
+
+    # Initial window size per view mode
+    GEOMETRIES = {0: "800x760", 1: "750x720", 2: "600x480"}
+
+    # Secondary views: name -> (frame attribute, populate method, scrollable)
+    VIEW_SPECS = {
+        'settings': ('settings_frame', '_populate_settings_tabs', True),
+        'help': ('help_frame', '_populate_help_content', False),
+        'hooker_mod': ('hooker_mod_frame', '_populate_hooker_mod_view', True),
+        'game_sync': ('game_sync_frame', '_populate_game_sync_view', True),
+        'character': ('character_frame', '_populate_character_view', False),
+        'ai_setup': ('ai_setup_frame', '_populate_ai_setup_view', True),
+        'chat': ('chat_frame', '_populate_chat_view', False),
+    }
+
+    # Header button (row, column) cells per width bucket: 4x1, 2x2, 1x4
+    HEADER_LAYOUTS = {
+        2: ((0, 0), (0, 1), (0, 2), (0, 3)),
+        1: ((0, 0), (0, 1), (1, 0), (1, 1)),
+        0: ((0, 0), (1, 0), (2, 0), (3, 0)),
+    }
+
+    # Root grid weights: sidebar/main area columns; status/header/content rows
+    ROOT_COLUMN_WEIGHTS = ((0, 0), (1, 1))
+    ROOT_ROW_WEIGHTS = ((0, 0), (1, 0), (2, 1))
+
     def setup_root_config(self):
         """
         Configure root window settings.
@@ -48,19 +139,20 @@ class UIInitMixin:
         Sets up grid weights for responsive layout and initial window geometry
         based on the current view mode.
         """
-        self.root.columnconfigure(0, weight=0)  # Sidebar
-        self.root.columnconfigure(1, weight=1)  # Main area
-        self.root.rowconfigure(0, weight=0)  # Ollama Status
-        self.root.rowconfigure(1, weight=0)  # Main header
-        self.root.rowconfigure(2, weight=1)  # Main content
+        for index, weight in self.ROOT_COLUMN_WEIGHTS:
+            self.root.columnconfigure(index, weight=weight)
+        for index, weight in self.ROOT_ROW_WEIGHTS:
+            self.root.rowconfigure(index, weight=weight)
+
+        # Resize debouncing state (see on_resize)
+        self._resize_after_id = None
+        self._last_size = None
+        self._header_layout_bucket = None
+        self._header_positions = None
 
         # Set initial window size based on view mode
-        if self.view_mode == 0:
-            self.root.geometry("800x760")
-        elif self.view_mode == 1:
-            self.root.geometry("750x720")
-        elif self.view_mode == 2:
-            self.root.geometry("600x480")
+        self._current_geo = self.GEOMETRIES.get(self.view_mode, self.GEOMETRIES[0])
+        self.root.geometry(self._current_geo)
 
     def setup_top_header(self):
         """
@@ -83,14 +175,14 @@ class UIInitMixin:
         and close partnership buttons with initial layout configuration.
         """
         # Ollama Status Zone (added first, at the very top)
-        if hasattr(self, 'ollama_ui'):
-             self.ollama_status_frame = self.ollama_ui.create_dashboard_zone(self.root)
-             self.ollama_status_frame.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=UIStyles.SPACE_LG, pady=(UIStyles.SPACE_LG, UIStyles.SPACE_SM))
+        if self.ollama_ui is not None:
+             self.ollama_status_frame = self.ollama_ui.create_dashboard_zone(self.dashboard_frame)
+             self.ollama_status_frame.grid(row=0, column=0, sticky=(tk.W, tk.E), padx=UIStyles.SPACE_LG, pady=(UIStyles.SPACE_LG, UIStyles.SPACE_SM))
+             self.ollama_ui.sync_initial_state()
              
-        self.header_frame = UIStyles.create_card_frame(self.root)
-        self.header_frame.grid(row=1, column=1, sticky=(tk.W, tk.E), padx=UIStyles.SPACE_LG, pady=(UIStyles.SPACE_LG, 0))
-        for i in range(5):
-            self.header_frame.columnconfigure(i, weight=1)
+        self.header_frame = UIStyles.create_card_frame(self.dashboard_frame)
+        self.header_frame.grid(row=1, column=0, sticky=(tk.W, tk.E), padx=UIStyles.SPACE_LG, pady=(UIStyles.SPACE_LG, 0))
+        # Column weights depend on the layout bucket; see update_header_layout
 
         # Buttons - calm neutral colors
         btn_height = 36
@@ -99,8 +191,7 @@ class UIInitMixin:
         self.clear_chat_button = UIStyles.create_secondary_button(self.header_frame, text="Clear Chat", command=self.on_clear_chat_click, state=tk.DISABLED, height=btn_height)
         self.close_partnership_button = UIStyles.create_secondary_button(self.header_frame, text="Close Partn", command=self.on_close_partnership_click, state=tk.DISABLED, height=btn_height)
 
-        # Initial layout
-        self.update_header_layout()
+        # Initial layout is applied by rebuild_ui at the end of setup_ui
 
     def setup_main_container(self):
         """
@@ -111,11 +202,10 @@ class UIInitMixin:
         Returns:
             ctk.CTkFrame: The configured main container frame.
         """
-        main_container = ctk.CTkFrame(self.root, fg_color="transparent")
-        main_container.grid(row=2, column=1, sticky=(tk.W, tk.E, tk.N, tk.S), padx=UIStyles.SPACE_LG, pady=(0, UIStyles.SPACE_SM))
+        main_container = ctk.CTkFrame(self.dashboard_frame, fg_color="transparent")
+        main_container.grid(row=2, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx=UIStyles.SPACE_LG, pady=(0, UIStyles.SPACE_SM))
         main_container.columnconfigure(0, weight=1)
-        
-        
+
         # Row configuration
         main_container.rowconfigure(0, weight=0)  # Nicks Header
         main_container.rowconfigure(1, weight=0)  # Nicks Content
@@ -134,9 +224,11 @@ class UIInitMixin:
         Args:
             parent: Parent widget to contain the logs frame.
         """
+        XS, SM, MD, XXL = UIStyles.SPACE_XS, UIStyles.SPACE_SM, UIStyles.SPACE_MD, UIStyles.SPACE_2XL
+
         # Header - always visible
         logs_header = ctk.CTkFrame(parent, fg_color="transparent")
-        logs_header.grid(row=2, column=0, sticky='ew', padx=0, pady=(UIStyles.SPACE_MD, UIStyles.SPACE_XS))
+        logs_header.grid(row=2, column=0, sticky='ew', padx=0, pady=(MD, XS))
         logs_header.columnconfigure(0, weight=1)
         
         UIStyles.create_section_header(logs_header, text="System Logs", font=UIStyles.FONT_H3).grid(row=0, column=0, sticky='w', padx=(15, 0))
@@ -148,23 +240,24 @@ class UIInitMixin:
 
         # Logs content - Togglable
         self.logs_content_frame = UIStyles.create_card_frame(parent)
-        self.logs_content_frame.grid(row=3, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx=0, pady=(0, UIStyles.SPACE_SM))
+        self.logs_content_frame.grid(row=3, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx=0, pady=(0, SM))
         self.logs_content_frame.columnconfigure(0, weight=1)
         self.logs_content_frame.rowconfigure(0, weight=1)
 
         # Terminal-style text area - white text with rounded container
         text_container = ctk.CTkFrame(self.logs_content_frame, fg_color="#0f172a", corner_radius=8)
-        text_container.grid(row=0, column=0, sticky='nsew', padx=UIStyles.SPACE_2XL, pady=UIStyles.SPACE_2XL)
+        text_container.grid(row=0, column=0, sticky='nsew', padx=XXL, pady=XXL)
         text_container.columnconfigure(0, weight=1)
         text_container.rowconfigure(0, weight=1)
         
         self.log_text = tk.Text(text_container, wrap=tk.WORD, bg="#0f172a", fg=UIStyles.TEXT_PRIMARY,
                                 font=UIStyles.FONT_MONO, borderwidth=0, relief='flat',
                                 selectbackground=UIStyles.PRIMARY_COLOR, highlightthickness=0)
-        self.log_text.grid(row=0, column=0, sticky='nsew', padx=UIStyles.SPACE_MD, pady=UIStyles.SPACE_MD)
+        self.log_text.grid(row=0, column=0, sticky='nsew', padx=MD, pady=MD)
         self.log_text.configure(state=tk.DISABLED)
-        # Ensure it expands
-        parent.rowconfigure(3, weight=1)
+        # Pending log lines, flushed together on the next idle tick
+        self._log_buf = collections.deque()
+        self._log_flush_scheduled = False
 
     def setup_sidebar_frame(self, parent):
         """Setup sidebar with nick lists and collapsible header."""
@@ -187,6 +280,15 @@ class UIInitMixin:
         for i in range(3):
             self.nicks_content_frame.columnconfigure(i, weight=1)
 
+        # The list cards are built by _build_nick_cards on first expand
+
+    def _build_nick_cards(self):
+        """
+        Build the Found/Ignored/Tracked list cards inside the nicks section.
+
+        Called the first time the collapsed nicks section is expanded, then
+        fills the new listboxes from the bot's current nick lists.
+        """
         def create_list_card(parent_frame, title, col, listbox_attr):
             card = UIStyles.create_card_frame(parent_frame)
             card.grid(row=0, column=col, sticky="nsew", padx=5, pady=0)
@@ -202,9 +304,9 @@ class UIInitMixin:
             list_container.columnconfigure(0, weight=1)
             list_container.rowconfigure(0, weight=1)
             
-            lb = tk.Listbox(list_container, height=5, bg="#0f172a", fg=UIStyles.TEXT_PRIMARY,
-                            font=UIStyles.FONT_NORMAL, borderwidth=0, relief='flat', highlightthickness=0, 
-                            selectbackground=UIStyles.PRIMARY_COLOR)
+            lb = VirtualListbox(list_container, height=5, bg="#0f172a", fg=UIStyles.TEXT_PRIMARY,
+                                font=UIStyles.FONT_NORMAL, borderwidth=0, relief='flat', highlightthickness=0,
+                                selectbackground=UIStyles.PRIMARY_COLOR)
             lb.grid(row=0, column=0, sticky="nsew", padx=UIStyles.SPACE_MD, pady=UIStyles.SPACE_MD)
             setattr(self, listbox_attr, lb)
             return card
@@ -224,6 +326,10 @@ class UIInitMixin:
         target_card = create_list_card(self.nicks_content_frame, "Tracked", 2, "target_listbox")
         UIStyles.create_secondary_button(target_card, text="Remove", command=lambda: self.remove_nick(self.target_listbox, "target"), height=28).grid(row=2, column=0, sticky="ew", padx=UIStyles.SPACE_LG, pady=(0, UIStyles.SPACE_LG))
 
+        self._nicks_built = True
+        if self.bot:
+            self.load_lists()
+
     def setup_footer_frame(self):
         """
         Setup footer (REMOVED).
@@ -236,6 +342,10 @@ class UIInitMixin:
         """
         Setup left sidebar with navigation buttons and controls.
         """
+        # Style constants used throughout the sidebar build
+        XS, SM, MD = UIStyles.SPACE_XS, UIStyles.SPACE_SM, UIStyles.SPACE_MD
+        TEXT_PRIMARY, HOVER_COLOR = UIStyles.TEXT_PRIMARY, UIStyles.HOVER_COLOR
+
         self.sidebar_frame = ctk.CTkFrame(self.root, width=180, fg_color=UIStyles.HEADER_BG, corner_radius=0)
         self.sidebar_frame.grid(row=0, column=0, rowspan=4, sticky=(tk.N, tk.S, tk.W), padx=0, pady=0)
         self.sidebar_frame.pack_propagate(False)
@@ -248,27 +358,24 @@ class UIInitMixin:
         nav_card = UIStyles.create_card_frame(self.sidebar_frame)
         nav_card.pack(fill=tk.X, padx=10, pady=(0, 10))
         
-        # Navigation Buttons with backgrounds
-        self.dashboard_button = UIStyles.create_secondary_button(nav_card, text="Dashboard", command=self.switch_to_dashboard)
-        self.dashboard_button.pack(fill=tk.X, padx=UIStyles.SPACE_MD, pady=(UIStyles.SPACE_MD, UIStyles.SPACE_XS))
-
-        self.chat_button_sidebar = UIStyles.create_secondary_button(nav_card, text="Chat", command=self.switch_to_chat)
-        self.chat_button_sidebar.pack(fill=tk.X, padx=UIStyles.SPACE_MD, pady=UIStyles.SPACE_XS)
-
-        self.character_button_sidebar = UIStyles.create_secondary_button(nav_card, text="Character", command=self.switch_to_character)
-        self.character_button_sidebar.pack(fill=tk.X, padx=UIStyles.SPACE_MD, pady=UIStyles.SPACE_XS)
-
-        self.settings_button_sidebar = UIStyles.create_secondary_button(nav_card, text="Prompts", command=self.switch_to_settings)
-        self.settings_button_sidebar.pack(fill=tk.X, padx=UIStyles.SPACE_MD, pady=UIStyles.SPACE_XS)
-
-        self.hooker_mod_button_sidebar = UIStyles.create_secondary_button(nav_card, text="Hooker Mod", command=self.switch_to_hooker_mod)
-        self.hooker_mod_button_sidebar.pack(fill=tk.X, padx=UIStyles.SPACE_MD, pady=UIStyles.SPACE_XS)
-
-        self.game_sync_button_sidebar = UIStyles.create_secondary_button(nav_card, text="Game Sync", command=self.switch_to_game_sync)
-        self.game_sync_button_sidebar.pack(fill=tk.X, padx=UIStyles.SPACE_MD, pady=UIStyles.SPACE_XS)
-
-        self.ai_setup_button_sidebar = UIStyles.create_secondary_button(nav_card, text="AI Setup", command=self.switch_to_ai_setup)
-        self.ai_setup_button_sidebar.pack(fill=tk.X, padx=UIStyles.SPACE_MD, pady=(UIStyles.SPACE_XS, UIStyles.SPACE_MD))
+        # Navigation Buttons with backgrounds: (text, attribute, command)
+        nav_items = (
+            ("Dashboard", 'dashboard_button', self.switch_to_dashboard),
+            ("Chat", 'chat_button_sidebar', self.switch_to_chat),
+            ("Character", 'character_button_sidebar', self.switch_to_character),
+            ("Prompts", 'settings_button_sidebar', self.switch_to_settings),
+            ("Hooker Mod", 'hooker_mod_button_sidebar', self.switch_to_hooker_mod),
+            ("Game Sync", 'game_sync_button_sidebar', self.switch_to_game_sync),
+            ("AI Setup", 'ai_setup_button_sidebar', self.switch_to_ai_setup),
+        )
+        last = len(nav_items) - 1
+        for i, (text, attr, command) in enumerate(nav_items):
+            # Created in the neutral sidebar style that update_sidebar_active restores
+            btn = UIStyles.create_secondary_button(nav_card, text=text, command=command,
+                                                   hover_color=HOVER_COLOR, border_width=0)
+            pady = (MD if i == 0 else XS, MD if i == last else XS)
+            btn.pack(fill=tk.X, padx=MD, pady=pady)
+            setattr(self, attr, btn)
 
         # Zone 2: Toggle Switches
         switches_card = UIStyles.create_card_frame(self.sidebar_frame)
@@ -277,47 +384,25 @@ class UIInitMixin:
         # Toggle Switches with larger, thicker font
         TOGGLE_FONT = UIStyles.FONT_H3
 
-        # Translation Layer switch
-        ctk.CTkLabel(switches_card, text="Translation", font=TOGGLE_FONT, text_color=UIStyles.TEXT_PRIMARY).pack(anchor='w', padx=UIStyles.SPACE_MD, pady=(UIStyles.SPACE_MD, UIStyles.SPACE_XS))
-        self.translation_layer_switch = ctk.CTkSwitch(
-            switches_card, text="", variable=self.use_translation_var,
-            command=self.on_translation_toggle,
-            fg_color=UIStyles.HOVER_COLOR, progress_color=UIStyles.HOVER_COLOR, button_color="#FFFFFF"
-        )
-        self.translation_layer_switch.pack(anchor='w', padx=UIStyles.SPACE_MD, pady=(0, UIStyles.SPACE_SM))
-
-        # Auto-mode switch
-        ctk.CTkLabel(switches_card, text="Auto-mode", font=TOGGLE_FONT, text_color=UIStyles.TEXT_PRIMARY).pack(anchor='w', padx=UIStyles.SPACE_MD, pady=(0, UIStyles.SPACE_XS))
-        self.auto_mode_switch = ctk.CTkSwitch(
-            switches_card, text="", variable=self.autonomous_var,
-            command=self.on_autonomous_toggle,
-            fg_color=UIStyles.HOVER_COLOR, progress_color=UIStyles.HOVER_COLOR, button_color="#FFFFFF"
-        )
-        self.auto_mode_switch.pack(anchor='w', padx=UIStyles.SPACE_MD, pady=(0, UIStyles.SPACE_SM))
-
-        # Hooker Mod switch
-        ctk.CTkLabel(switches_card, text="Hooker Mod", font=TOGGLE_FONT, text_color=UIStyles.TEXT_PRIMARY).pack(anchor='w', padx=UIStyles.SPACE_MD, pady=(0, UIStyles.SPACE_XS))
-        self.hooker_switch = ctk.CTkSwitch(
-            switches_card, text="", variable=self.hooker_enabled_var,
-            command=self.on_hooker_toggle,
-            fg_color=UIStyles.HOVER_COLOR, progress_color=UIStyles.HOVER_COLOR, button_color="#FFFFFF"
-        )
-        self.hooker_switch.pack(anchor='w', padx=UIStyles.SPACE_MD, pady=(0, UIStyles.SPACE_SM))
-
-        # Show Zones switch
-        ctk.CTkLabel(switches_card, text="Show Zones", font=TOGGLE_FONT, text_color=UIStyles.TEXT_PRIMARY).pack(anchor='w', padx=UIStyles.SPACE_MD, pady=(0, UIStyles.SPACE_XS))
-        self.show_zones_switch = ctk.CTkSwitch(
-            switches_card, text="", variable=self.show_zones_var,
-            command=self.on_toggle_overlay,
-            fg_color=UIStyles.HOVER_COLOR, progress_color=UIStyles.HOVER_COLOR, button_color="#FFFFFF"
+        # (label, variable, command, attribute)
+        toggle_items = (
+            ("Translation", self.use_translation_var,
+             self._make_toggle(self.use_translation_var, 'use_translation_layer', "Translation layer"), 'translation_layer_switch'),
+            ("Auto-mode", self.autonomous_var, self.on_autonomous_toggle, 'auto_mode_switch'),
+            ("Hooker Mod", self.hooker_enabled_var,
+             self._make_toggle(self.hooker_enabled_var, 'hooker_mod_enabled', "Hooker Mod"), 'hooker_switch'),
+            ("Show Zones", self.show_zones_var, self.on_toggle_overlay, 'show_zones_switch'),
         )
-        self.show_zones_switch.pack(anchor='w', padx=UIStyles.SPACE_MD, pady=(0, UIStyles.SPACE_MD))
+        last = len(toggle_items) - 1
+        for i, (label, var, command, attr) in enumerate(toggle_items):
+            self._add_toggle(switches_card, label, var, command, attr,
+                             top=MD if i == 0 else 0, bottom=MD if i == last else SM)
 
         # Zone 3: Language & Help
         settings_card = UIStyles.create_card_frame(self.sidebar_frame)
         settings_card.pack(fill=tk.X, padx=10, pady=(0, 10))
 
-        ctk.CTkLabel(settings_card, text="Language", font=TOGGLE_FONT, text_color=UIStyles.TEXT_PRIMARY).pack(anchor='w', padx=UIStyles.SPACE_MD, pady=(UIStyles.SPACE_MD, UIStyles.SPACE_XS))
+        ctk.CTkLabel(settings_card, text="Language", font=TOGGLE_FONT, text_color=TEXT_PRIMARY).pack(anchor='w', padx=MD, pady=(MD, XS))
         language_options = ["en", "ru", "fr", "es", "it", "de"]
         self.language_dropdown = ctk.CTkOptionMenu(
             settings_card, 
@@ -328,216 +413,236 @@ class UIInitMixin:
             button_color=UIStyles.PRIMARY_COLOR,
             button_hover_color=UIStyles.PRIMARY_HOVER,
             dropdown_fg_color=UIStyles.CARD_BG,
-            dropdown_hover_color=UIStyles.HOVER_COLOR,
-            text_color=UIStyles.TEXT_PRIMARY,
+            dropdown_hover_color=HOVER_COLOR,
+            text_color=TEXT_PRIMARY,
             font=UIStyles.FONT_NORMAL
         )
-        self.language_dropdown.pack(anchor='w', fill=tk.X, padx=UIStyles.SPACE_MD, pady=(0, UIStyles.SPACE_SM))
+        self.language_dropdown.pack(anchor='w', fill=tk.X, padx=MD, pady=(0, SM))
 
         # Help button - using standard styling but will be highlighted when active
-        self.help_button = UIStyles.create_secondary_button(settings_card, text="❓ Help", command=self.switch_to_help, height=32)
-        self.help_button.pack(anchor='w', fill=tk.X, padx=UIStyles.SPACE_MD, pady=(0, UIStyles.SPACE_MD))
-        
-        # Highlight active page
-        self.update_sidebar_active()
-
-        # Set initial switch colors based on variables
-        if self.use_translation_var.get():
-            self.translation_layer_switch.configure(fg_color=UIStyles.HOVER_COLOR, progress_color=UIStyles.HOVER_COLOR)
-        else:
-            self.translation_layer_switch.configure(fg_color=UIStyles.DISABLED_COLOR, progress_color=UIStyles.DISABLED_COLOR)
-
-        if self.show_zones_var.get():
-            self.show_zones_switch.configure(fg_color=UIStyles.HOVER_COLOR, progress_color=UIStyles.HOVER_COLOR)
-        else:
-            self.show_zones_switch.configure(fg_color=UIStyles.DISABLED_COLOR, progress_color=UIStyles.DISABLED_COLOR)
-
-        if self.autonomous_var.get():
-            self.auto_mode_switch.configure(fg_color=UIStyles.HOVER_COLOR, progress_color=UIStyles.HOVER_COLOR)
-        else:
-            self.auto_mode_switch.configure(fg_color=UIStyles.DISABLED_COLOR, progress_color=UIStyles.DISABLED_COLOR)
-
-        if self.hooker_enabled_var.get():
-            self.hooker_switch.configure(fg_color=UIStyles.HOVER_COLOR, progress_color=UIStyles.HOVER_COLOR)
-        else:
-            self.hooker_switch.configure(fg_color=UIStyles.DISABLED_COLOR, progress_color=UIStyles.DISABLED_COLOR)
+        self.help_button = UIStyles.create_secondary_button(settings_card, text="❓ Help", command=self.switch_to_help, height=32,
+                                                            hover_color=HOVER_COLOR, border_width=0)
+        self.help_button.pack(anchor='w', fill=tk.X, padx=MD, pady=(0, MD))
+
+        # View name -> sidebar button, recolored by update_sidebar_active
+        self._view_buttons = {
+            'dashboard': self.dashboard_button,
+            'settings': self.settings_button_sidebar,
+            'hooker_mod': self.hooker_mod_button_sidebar,
+            'game_sync': self.game_sync_button_sidebar,
+            'character': self.character_button_sidebar,
+            'ai_setup': self.ai_setup_button_sidebar,
+            'chat': self.chat_button_sidebar,
+            'help': self.help_button,
+        }
+        self._prev_active_button = None
 
         # Set initial active
         self.update_sidebar_active()
         self.update_switch_colors()
 
+    def _add_toggle(self, parent, label, var, command, attr, top=0, bottom=UIStyles.SPACE_SM):
+        """
+        Add a labelled sidebar switch and store it on the given attribute.
+
+        Args:
+            parent: Card frame to pack the label and switch into.
+            label (str): Text shown above the switch.
+            var: Variable bound to the switch.
+            command (callable): Called when the switch is toggled.
+            attr (str): Attribute name for the switch.
+            top (int): Padding above the label.
+            bottom (int): Padding below the switch.
+
+        Returns:
+            ctk.CTkSwitch: The created switch.
+        """
+        MD = UIStyles.SPACE_MD
+        ctk.CTkLabel(parent, text=label, font=UIStyles.FONT_H3, text_color=UIStyles.TEXT_PRIMARY).pack(anchor='w', padx=MD, pady=(top, UIStyles.SPACE_XS))
+        switch = ctk.CTkSwitch(
+            parent, text="", variable=var,
+            command=command,
+            fg_color=UIStyles.HOVER_COLOR, progress_color=UIStyles.HOVER_COLOR, button_color="#FFFFFF"
+        )
+        switch.pack(anchor='w', padx=MD, pady=(0, bottom))
+        setattr(self, attr, switch)
+        return switch
+
     def switch_to_dashboard(self):
         """
         Switch to dashboard view.
         """
-        self.current_view = 'dashboard'
-        self.update_sidebar_active()
-        self.show_dashboard_view()
+        self._switch_view('dashboard')
 
     def switch_to_settings(self):
         """
         Switch to settings view.
         """
-        self.current_view = 'settings'
-        self.update_sidebar_active()
-        self.show_settings_view()
+        self._switch_view('settings')
 
     def switch_to_help(self):
         """
         Switch to help view.
         """
-        self.current_view = 'help'
-        self.update_sidebar_active()
-        self.show_help_view()
+        self._switch_view('help')
 
     def switch_to_hooker_mod(self):
         """
         Switch to hooker mod view.
         """
-        self.current_view = 'hooker_mod'
-        self.update_sidebar_active()
-        self.show_hooker_mod_view()
+        # Update hooker var from bot
+        if self.bot:
+            self.hooker_enabled_var.set(self.bot.hooker_mod_enabled)
+        self._switch_view('hooker_mod')
 
     def switch_to_game_sync(self):
         """
         Switch to game sync view.
         """
-        self.current_view = 'game_sync'
-        self.update_sidebar_active()
-        self.show_game_sync_view()
+        self._switch_view('game_sync')
 
     def switch_to_character(self):
         """
         Switch to character view.
         """
-        self.current_view = 'character'
-        self.update_sidebar_active()
-        self.show_character_view()
+        self._switch_view('character')
 
     def switch_to_ai_setup(self):
         """
         Switch to AI setup view.
         """
-        self.current_view = 'ai_setup'
-        self.update_sidebar_active()
-        self.show_ai_setup_view()
+        self._switch_view('ai_setup')
 
     def switch_to_chat(self):
         """
         Switch to chat view.
         """
-        self.current_view = 'chat'
+        self._switch_view('chat')
+
+    def _switch_view(self, name):
+        """
+        Make a view current: highlight its sidebar button and show it.
+
+        Args:
+            name (str): View name (a VIEW_SPECS key or 'dashboard').
+        """
+        self.current_view = name
         self.update_sidebar_active()
-        self.show_chat_view()
-
-    def _hide_all_views(self):
-        """
-        Hide all view frames and show main UI.
-        """
-        # Hide all secondary views
-        if hasattr(self, 'settings_frame'):
-            self.settings_frame.grid_remove()
-        if hasattr(self, 'hooker_mod_frame'):
-            self.hooker_mod_frame.grid_remove()
-        if hasattr(self, 'game_sync_frame'):
-            self.game_sync_frame.grid_remove()
-        if hasattr(self, 'help_frame'):
-            self.help_frame.grid_remove()
-        if hasattr(self, 'character_frame'):
-            self.character_frame.grid_remove()
-        if hasattr(self, 'ai_setup_frame'):
-            self.ai_setup_frame.grid_remove()
-        if hasattr(self, 'chat_frame'):
-            self.chat_frame.grid_remove()
-
-        # Hide main UI
-        self.header_frame.grid_remove()
-        self.main_container.grid_remove()
-        if hasattr(self, 'footer_frame'):
-            self.footer_frame.grid_remove()
-
-    def show_help_view(self):
-        """
-        Show help view.
-        """
-        # Hide other views
-        self._hide_all_views()
-
-        # Show help
-        if not hasattr(self, 'help_frame'):
-            self.help_frame = ctk.CTkScrollableFrame(self.root, width=self.root.winfo_width() - 180,
-                                                      height=self.root.winfo_height(), fg_color="transparent")
-            self.help_frame.grid(row=0, column=1, rowspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), padx=5, pady=5)
-            self._populate_help_content()
+        self._show_view(name)
+
+    def _show_view(self, name):
+        """
+        Show a view by name.
+
+        The dashboard is always built; every other view is looked up in
+        VIEW_SPECS and built on first use.
+
+        Args:
+            name (str): View name (a VIEW_SPECS key or 'dashboard').
+        """
+        if name == 'dashboard':
+            self._raise_view(self.dashboard_frame)
+            return
+        frame_attr, populate, scrollable = self.VIEW_SPECS[name]
+        self._show_lazy_view(frame_attr, getattr(self, populate), scrollable)
+
+    def _get_or_build(self, key, builder):
+        """
+        Return a cached view frame, building it the first time.
+
+        Args:
+            key (str): View cache key.
+            builder (callable): Creates and populates the frame.
+
+        Returns:
+            The cached frame.
+        """
+        frame = self._view_cache.get(key)
+        if frame is None:
+            frame = builder()
+            self._view_cache[key] = frame
+        return frame
+
+    def _show_lazy_view(self, frame_attr, populate, scrollable=True):
+        """
+        Show a secondary view, building it on first use.
+
+        The frame and its content are only created the first time the view is
+        opened; later visits just raise the cached frame to the top of the
+        view stack, which needs no geometry pass.
+
+        Args:
+            frame_attr (str): Attribute name holding the view frame.
+            populate (callable): Fills the freshly created frame with widgets.
+            scrollable (bool): Whether the view uses a scrollable frame.
+        """
+        frame = self._get_or_build(frame_attr, lambda: self._build_view_frame(frame_attr, populate, scrollable))
+        self._raise_view(frame)
+
+    def _build_view_frame(self, frame_attr, populate, scrollable):
+        """
+        Create a view frame in the view stack and populate it.
+
+        Args:
+            frame_attr (str): Attribute name to store the frame under.
+            populate (callable): Fills the frame with widgets.
+            scrollable (bool): Whether to use a scrollable frame.
+
+        Returns:
+            The new frame.
+        """
+        # No fixed size: the nsew grid cell in the weighted view stack sizes
+        # the frame and keeps it in step with the window
+        if scrollable:
+            frame = ctk.CTkScrollableFrame(self.view_stack, fg_color="transparent")
         else:
-            self.help_frame.grid(row=0, column=1, rowspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), padx=5, pady=5)
+            frame = ctk.CTkFrame(self.view_stack, fg_color="transparent")
+        # Populate methods reach the frame through this attribute
+        setattr(self, frame_attr, frame)
+        frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx=5, pady=5)
+        populate()
+        return frame
 
-    def _populate_help_content(self):
-        # Page title
-        ctk.CTkLabel(self.help_frame, text="Help & Instructions", 
-                      font=(UIStyles.FONT_FAMILY, UIStyles.FONT_SIZE_DISPLAY, "bold"), 
-                      text_color=UIStyles.TEXT_PRIMARY).pack(anchor='w', padx=UIStyles.SPACE_2XL, pady=(UIStyles.SPACE_2XL, UIStyles.SPACE_LG))
-        
-        # Instructions card
-        instructions_card = UIStyles.create_card_frame(self.help_frame)
-        instructions_card.pack(fill='x', padx=UIStyles.SPACE_2XL, pady=UIStyles.SPACE_LG)
-        
-        ctk.CTkLabel(instructions_card, text="Getting Started",
-                      font=UIStyles.FONT_TITLE, text_color=UIStyles.TEXT_PRIMARY).pack(anchor='w', padx=UIStyles.SPACE_2XL, pady=(UIStyles.SPACE_2XL, UIStyles.SPACE_MD))
-        
-        instructions_text = """1. Screen Area Setup:
-   - Click the "Configure Zones" button in Game Sync.
-   - Follow instructions to select areas: chat, input field, partnership, and poses.
-   - This is necessary for the bot to work correctly.
+    def _raise_view(self, frame):
+        """
+        Raise a view frame to the top of the view stack.
 
-2. Starting the Bot:
-   - Click "Start" to launch the bot.
-   - Press F2 to begin chat scanning.
-   - The bot will automatically respond to tracked nicks.
+        Does nothing when the frame is already the active view.
 
-3. Nick Management:
-   - Ignored: Messages from these nicks are ignored.
-   - Tracked: The bot responds to messages from these nicks.
-   - New nicks appear in the "Found" list.
+        Args:
+            frame: View frame to show.
+        """
+        if frame is self._active_view_widget:
+            return
+        frame.lift()
+        self._active_view_widget = frame
 
-4. Autonomous Mode:
-   - Enable "Auto-mode" for automatic pose/partnership scanning.
-   - Set your preferred inactivity timeout.
+    def _populate_help_content(self):
+        """
+        Populate the help view.
 
-5. Pose Management:
-   - Unknown poses trigger a customizable message.
-   - Users can provide descriptions that get saved.
-   - Customize messages for different languages in Prompts.
+        All static help text goes into one read-only Text widget, with tags
+        for the headings, instead of a separate label per block.
+        """
+        card = UIStyles.create_card_frame(self.help_frame)
+        card.pack(fill='both', expand=True, padx=UIStyles.SPACE_2XL, pady=UIStyles.SPACE_2XL)
 
-6. Manual Sending:
-   - Enter text in the bottom field and press "Send" or Enter."""
-        
-        ctk.CTkLabel(instructions_card, text=instructions_text, 
-                      justify="left", anchor="w", 
-                      font=UIStyles.FONT_NORMAL,
-                      text_color=UIStyles.TEXT_SECONDARY).pack(anchor="w", padx=UIStyles.SPACE_2XL, pady=(0, UIStyles.SPACE_2XL))
-
-        # Hotkeys card  
-        hotkeys_card = UIStyles.create_card_frame(self.help_frame)
-        hotkeys_card.pack(fill='x', padx=UIStyles.SPACE_2XL, pady=(0, UIStyles.SPACE_LG))
-        
-        ctk.CTkLabel(hotkeys_card, text="Keyboard Shortcuts",
-                      font=UIStyles.FONT_TITLE, text_color=UIStyles.TEXT_PRIMARY).pack(anchor='w', padx=UIStyles.SPACE_2XL, pady=(UIStyles.SPACE_2XL, UIStyles.SPACE_MD))
-        
-        hotkeys_text = """F2: Pause/Resume chat scanning
-F3: Show/Hide window
-F4: Clear chat history in HiWaifu
-F5-F12: Send preset phrases (configured in Prompts)
+        text = tk.Text(card, wrap=tk.WORD, bg=UIStyles.SURFACE_COLOR, fg=UIStyles.TEXT_SECONDARY,
+                       font=UIStyles.FONT_NORMAL, borderwidth=0, relief='flat', highlightthickness=0,
+                       padx=UIStyles.SPACE_2XL, pady=UIStyles.SPACE_2XL, cursor='arrow')
+        text.pack(fill='both', expand=True, padx=UIStyles.RADIUS_LG, pady=UIStyles.RADIUS_LG)
+        text.tag_configure('title', font=UIStyles.FONT_DISPLAY, foreground=UIStyles.TEXT_PRIMARY,
+                           spacing3=UIStyles.SPACE_LG)
+        text.tag_configure('h2', font=UIStyles.FONT_TITLE, foreground=UIStyles.TEXT_PRIMARY,
+                           spacing1=UIStyles.SPACE_2XL, spacing3=UIStyles.SPACE_MD)
 
-Ctrl+E: Change HiWaifu language to English
-Ctrl+R: Change language to Russian
-Ctrl+F: Change language to French
-Ctrl+S: Change language to Spanish"""
-        
-        ctk.CTkLabel(hotkeys_card, text=hotkeys_text,
-                      justify="left", anchor="w",
-                      font=UIStyles.FONT_NORMAL,
-                      text_color=UIStyles.TEXT_SECONDARY).pack(anchor="w", padx=UIStyles.SPACE_2XL, pady=(0, UIStyles.SPACE_2XL))
+        text.insert(tk.END,
+                    "Help & Instructions\n", 'title',
+                    "Getting Started\n", 'h2',
+                    _HELP_INSTRUCTIONS_TEXT + "\n", (),
+                    "Keyboard Shortcuts\n", 'h2',
+                    _HELP_HOTKEYS_TEXT, ())
+        text.configure(state=tk.DISABLED)
 
     def _populate_character_view(self):
         """
@@ -556,9 +661,11 @@ Ctrl+S: Change language to Spanish"""
                       font=(UIStyles.FONT_FAMILY, UIStyles.FONT_SIZE_DISPLAY, "bold"),
                       text_color=UIStyles.TEXT_PRIMARY).pack(anchor='w', padx=UIStyles.SPACE_2XL, pady=(UIStyles.SPACE_2XL, UIStyles.SPACE_LG))
 
-        # Create Ollama zones if Ollama UI is available
-        if hasattr(self, 'ollama_ui'):
-            self.ai_setup_zones = self.ollama_ui.create_ai_setup_zones(self.ai_setup_frame)
+        # Create Ollama zones if Ollama UI is available; the first (visible)
+        # zone is built now, the ones below the fold on the following ticks
+        if self.ollama_ui is not None:
+            self.ai_setup_zones = {}
+            self._populate_in_chunks(self.ollama_ui.ai_setup_zone_steps(self.ai_setup_frame, self.ai_setup_zones))
         else:
             # Fallback content
             ai_card = UIStyles.create_card_frame(self.ai_setup_frame)
@@ -567,221 +674,61 @@ Ctrl+S: Change language to Spanish"""
             ctk.CTkLabel(ai_card, text="AI Configuration",
                           font=UIStyles.FONT_TITLE, text_color=UIStyles.TEXT_PRIMARY).pack(anchor='w', padx=UIStyles.SPACE_2XL, pady=(UIStyles.SPACE_2XL, UIStyles.SPACE_MD))
 
-            ai_text = """Configure AI model settings and parameters here.
-
-This section allows you to:
-- Select AI model and provider
-- Set temperature and other generation parameters
-- Configure API endpoints
-- Set up model-specific options
-
-Note: This feature is under development."""
-            ctk.CTkLabel(ai_card, text=ai_text,
+            ctk.CTkLabel(ai_card, text=_AI_SETUP_FALLBACK_TEXT,
                           justify="left", anchor="w",
                           font=UIStyles.FONT_NORMAL,
                           text_color=UIStyles.TEXT_SECONDARY).pack(anchor="w", padx=UIStyles.SPACE_2XL, pady=(0, UIStyles.SPACE_2XL))
 
-    def _populate_chat_view(self):
+    def _populate_in_chunks(self, steps, first=1):
         """
-        Populate the chat view content via UIChatMixin.
-        """
-        # This will be handled by UIChatMixin._populate_chat_view
-        if hasattr(super(), '_populate_chat_view'):
-            super()._populate_chat_view()
+        Run widget-building steps, deferring all but the first few.
 
-    def show_hooker_mod_view(self):
-        """
-        Show hooker mod view.
+        Args:
+            steps (list): Callables that each build part of a view.
+            first (int): Number of steps to run synchronously.
         """
-        # Update hooker var from bot
-        if hasattr(self, 'bot') and self.bot:
-            self.hooker_enabled_var.set(getattr(self.bot, 'hooker_mod_enabled', False))
-
-        # Hide other views
-        self._hide_all_views()
-
-        # Show hooker mod
-        if not hasattr(self, 'hooker_mod_frame'):
-            self.hooker_mod_frame = ctk.CTkScrollableFrame(self.root, width=self.root.winfo_width() - 180,
-                                                           height=self.root.winfo_height(), fg_color="transparent")
-            self.hooker_mod_frame.grid(row=0, column=1, rowspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), padx=5, pady=5)
-            self._populate_hooker_mod_view()
-        else:
-            self.hooker_mod_frame.grid(row=0, column=1, rowspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), padx=5, pady=5)
-
-    def show_game_sync_view(self):
-        """
-        Show game sync view.
-        """
-        # Hide settings if shown
-        if hasattr(self, 'settings_frame'):
-            self.settings_frame.grid_remove()
-
-        # Hide hooker mod frame if shown
-        if hasattr(self, 'hooker_mod_frame'):
-            self.hooker_mod_frame.grid_remove()
-
-        # Hide help if shown
-        if hasattr(self, 'help_frame'):
-            self.help_frame.grid_remove()
-
-        # Hide character, ai_setup, chat frames if shown
-        if hasattr(self, 'character_frame'):
-            self.character_frame.grid_remove()
-        if hasattr(self, 'ai_setup_frame'):
-            self.ai_setup_frame.grid_remove()
-        if hasattr(self, 'chat_frame'):
-            self.chat_frame.grid_remove()
-
-        # Hide main UI
-        self.header_frame.grid_remove()
-        self.main_container.grid_remove()
-        if hasattr(self, 'footer_frame'):
-            self.footer_frame.grid_remove()
-
-        # Show game sync
-        if not hasattr(self, 'game_sync_frame'):
-            self.game_sync_frame = ctk.CTkScrollableFrame(self.root, width=self.root.winfo_width() - 180,
-                                                          height=self.root.winfo_height(), fg_color="transparent")
-            self.game_sync_frame.grid(row=0, column=1, rowspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), padx=5, pady=5)
-            self._populate_game_sync_view()
-        else:
-            self.game_sync_frame.grid(row=0, column=1, rowspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), padx=5, pady=5)
+        for step in steps[:first]:
+            step()
+        queue = collections.deque(steps[first:])
+        if queue:
+            self.root.after_idle(self._drain_populate_queue, queue)
 
-    def show_character_view(self):
-        """
-        Show character view.
+    def _drain_populate_queue(self, queue):
         """
-        # Hide other views
-        self._hide_all_views()
+        Run the next batch of deferred build steps and reschedule the rest.
 
-        # Show character
-        if not hasattr(self, 'character_frame'):
-            self.character_frame = ctk.CTkFrame(self.root, fg_color="transparent")
-            self.character_frame.grid(row=0, column=1, rowspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), padx=5, pady=5)
-            self._populate_character_view()
-        else:
-            self.character_frame.grid(row=0, column=1, rowspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), padx=5, pady=5)
-
-    def show_ai_setup_view(self):
-        """
-        Show AI setup view.
+        Args:
+            queue (collections.deque): Remaining build steps.
         """
-        # Hide other views
-        self._hide_all_views()
+        for _ in range(min(self.POPULATE_BATCH, len(queue))):
+            queue.popleft()()
+        if queue:
+            self.root.after(16, self._drain_populate_queue, queue)
 
-        # Show AI setup
-        if not hasattr(self, 'ai_setup_frame'):
-            self.ai_setup_frame = ctk.CTkScrollableFrame(self.root, width=self.root.winfo_width() - 180,
-                                                         height=self.root.winfo_height(), fg_color="transparent")
-            self.ai_setup_frame.grid(row=0, column=1, rowspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), padx=5, pady=5)
-            self._populate_ai_setup_view()
-        else:
-            self.ai_setup_frame.grid(row=0, column=1, rowspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), padx=5, pady=5)
-
-    def show_chat_view(self):
+    def _populate_chat_view(self):
         """
-        Show chat view.
+        Populate the chat view content via UIChatMixin.
         """
-        # Hide other views
-        self._hide_all_views()
-
-        # Show chat
-        if not hasattr(self, 'chat_frame'):
-            self.chat_frame = ctk.CTkFrame(self.root, fg_color="transparent")
-            self.chat_frame.grid(row=0, column=1, rowspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), padx=5, pady=5)
-            self._populate_chat_view()
-        else:
-            self.chat_frame.grid(row=0, column=1, rowspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), padx=5, pady=5)
+        # This will be handled by UIChatMixin._populate_chat_view
+        if hasattr(super(), '_populate_chat_view'):
+            super()._populate_chat_view()
 
     def update_sidebar_active(self):
         """
         Update sidebar button colors based on current view.
         """
-        # Reset all to neutral secondary style
-        self.dashboard_button.configure(fg_color=UIStyles.SECONDARY_COLOR, hover_color=UIStyles.HOVER_COLOR, border_width=0)
-        self.settings_button_sidebar.configure(fg_color=UIStyles.SECONDARY_COLOR, hover_color=UIStyles.HOVER_COLOR, border_width=0)
-        self.hooker_mod_button_sidebar.configure(fg_color=UIStyles.SECONDARY_COLOR, hover_color=UIStyles.HOVER_COLOR, border_width=0)
-        self.game_sync_button_sidebar.configure(fg_color=UIStyles.SECONDARY_COLOR, hover_color=UIStyles.HOVER_COLOR, border_width=0)
-        self.character_button_sidebar.configure(fg_color=UIStyles.SECONDARY_COLOR, hover_color=UIStyles.HOVER_COLOR, border_width=0)
-        self.ai_setup_button_sidebar.configure(fg_color=UIStyles.SECONDARY_COLOR, hover_color=UIStyles.HOVER_COLOR, border_width=0)
-        self.chat_button_sidebar.configure(fg_color=UIStyles.SECONDARY_COLOR, hover_color=UIStyles.HOVER_COLOR, border_width=0)
-        self.help_button.configure(fg_color=UIStyles.SECONDARY_COLOR, hover_color=UIStyles.HOVER_COLOR, border_width=0)
+        # Only the previously active and the newly active buttons change
+        active = self._view_buttons.get(self.current_view)
 
+        prev = self._prev_active_button
+        if active is prev:
+            return
+        if prev is not None:
+            prev.configure(fg_color=UIStyles.SECONDARY_COLOR, hover_color=UIStyles.HOVER_COLOR)
         # Highlight active button with primary color
-        if self.current_view == 'dashboard':
-            self.dashboard_button.configure(fg_color=UIStyles.PRIMARY_COLOR, hover_color=UIStyles.PRIMARY_HOVER)
-        elif self.current_view == 'settings':
-            self.settings_button_sidebar.configure(fg_color=UIStyles.PRIMARY_COLOR, hover_color=UIStyles.PRIMARY_HOVER)
-        elif self.current_view == 'hooker_mod':
-            self.hooker_mod_button_sidebar.configure(fg_color=UIStyles.PRIMARY_COLOR, hover_color=UIStyles.PRIMARY_HOVER)
-        elif self.current_view == 'game_sync':
-            self.game_sync_button_sidebar.configure(fg_color=UIStyles.PRIMARY_COLOR, hover_color=UIStyles.PRIMARY_HOVER)
-        elif self.current_view == 'character':
-            self.character_button_sidebar.configure(fg_color=UIStyles.PRIMARY_COLOR, hover_color=UIStyles.PRIMARY_HOVER)
-        elif self.current_view == 'ai_setup':
-            self.ai_setup_button_sidebar.configure(fg_color=UIStyles.PRIMARY_COLOR, hover_color=UIStyles.PRIMARY_HOVER)
-        elif self.current_view == 'chat':
-            self.chat_button_sidebar.configure(fg_color=UIStyles.PRIMARY_COLOR, hover_color=UIStyles.PRIMARY_HOVER)
-        elif self.current_view == 'help':
-            self.help_button.configure(fg_color=UIStyles.PRIMARY_COLOR, hover_color=UIStyles.PRIMARY_HOVER)
-
-    def update_switch_colors(self):
-        """
-        Update sidebar switch colors based on their current state.
-        """
-        # Translation switch
-        if self.use_translation_var.get():
-            self.translation_layer_switch.configure(fg_color=UIStyles.HOVER_COLOR, progress_color=UIStyles.HOVER_COLOR)
-        else:
-            self.translation_layer_switch.configure(fg_color=UIStyles.DISABLED_COLOR, progress_color=UIStyles.DISABLED_COLOR)
-
-        # Zones switch
-        if self.show_zones_var.get():
-            self.show_zones_switch.configure(fg_color=UIStyles.HOVER_COLOR, progress_color=UIStyles.HOVER_COLOR)
-        else:
-            self.show_zones_switch.configure(fg_color=UIStyles.DISABLED_COLOR, progress_color=UIStyles.DISABLED_COLOR)
-
-        # Auto-mode switch
-        if self.autonomous_var.get():
-            self.auto_mode_switch.configure(fg_color=UIStyles.HOVER_COLOR, progress_color=UIStyles.HOVER_COLOR)
-        else:
-            self.auto_mode_switch.configure(fg_color=UIStyles.DISABLED_COLOR, progress_color=UIStyles.DISABLED_COLOR)
-
-        # Hooker switch
-        if self.hooker_enabled_var.get():
-            self.hooker_switch.configure(fg_color=UIStyles.HOVER_COLOR, progress_color=UIStyles.HOVER_COLOR)
-        else:
-            self.hooker_switch.configure(fg_color=UIStyles.DISABLED_COLOR, progress_color=UIStyles.DISABLED_COLOR)
-
-    def show_dashboard_view(self):
-        """
-        Show dashboard view (main UI components).
-        """
-        # Hide all secondary views
-        self._hide_all_views()
-
-        # Show main UI
-        self.header_frame.grid()
-        self.main_container.grid()
-        
-        # Ollama status is already created in setup_main_header, no need to duplicate
-
-    def show_settings_view(self):
-        """
-        Show settings view.
-        """
-        # Hide other views
-        self._hide_all_views()
-
-        # Show settings
-        if not hasattr(self, 'settings_frame'):
-            self.settings_frame = ctk.CTkScrollableFrame(self.root, width=self.root.winfo_width() - 180,
-                                                         height=self.root.winfo_height(), fg_color="transparent")
-            self.settings_frame.grid(row=0, column=1, rowspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), padx=5, pady=5)
-            self._populate_settings_tabs()
-        else:
-            self.settings_frame.grid(row=0, column=1, rowspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), padx=5, pady=5)
+        if active is not None:
+            active.configure(fg_color=UIStyles.PRIMARY_COLOR, hover_color=UIStyles.PRIMARY_HOVER)
+        self._prev_active_button = active
 
     def setup_ui(self):
         """
@@ -794,6 +741,22 @@ Note: This feature is under development."""
         self.logs_collapsed = False
         self.setup_root_config()
         self.setup_sidebar()
+
+        # All views share one grid cell; switching views just raises one
+        self.view_stack = ctk.CTkFrame(self.root, fg_color="transparent", corner_radius=0)
+        self.view_stack.grid(row=0, column=1, rowspan=3, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.view_stack.columnconfigure(0, weight=1)
+        self.view_stack.rowconfigure(0, weight=1)
+
+        # Dashboard holds the Ollama status, control header and main container
+        self.dashboard_frame = ctk.CTkFrame(self.view_stack, fg_color="transparent", corner_radius=0)
+        self.dashboard_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.dashboard_frame.columnconfigure(0, weight=1)
+        self.dashboard_frame.rowconfigure(0, weight=0)  # Ollama Status
+        self.dashboard_frame.rowconfigure(1, weight=0)  # Main header
+        self.dashboard_frame.rowconfigure(2, weight=1)  # Main content
+        self._active_view_widget = self.dashboard_frame
+
         self.setup_main_header()
 
         # Bind resize event
@@ -803,7 +766,9 @@ Note: This feature is under development."""
         # Setup Logs
         self.setup_logs_frame(self.main_container)
         
-        self.setup_sidebar_frame(self.main_container)
+        # The collapsed nicks section is not needed for the first paint;
+        # nothing reads it before the user expands it
+        self.root.after_idle(self.setup_sidebar_frame, self.main_container)
         self.setup_footer_frame()
 
         # Initial rebuild to apply compact mode
@@ -817,30 +782,35 @@ Note: This feature is under development."""
         clear chat, close partnership) into different grid configurations
         based on available window width for optimal usability.
         """
-        # First, forget all current positions
-        for widget in self.header_frame.winfo_children():
-            widget.grid_forget()
-
-        width = self.root.winfo_width() - 180  # Subtract sidebar width
-        buttons = [self.start_button, self.pause_button, self.clear_chat_button, self.close_partnership_button]
-
-        if width > 1000:
-            # 1 row, 4 columns
-            for i in range(4):
-                self.header_frame.columnconfigure(i, weight=1)
-            for i, btn in enumerate(buttons):
-                btn.grid(row=0, column=i, padx=5, pady=5, sticky='ew')
-        elif width > 600:
-            # 2 rows, 2 columns
-            for i in range(2):
-                self.header_frame.columnconfigure(i, weight=1)
-            for i, btn in enumerate(buttons):
-                btn.grid(row=i // 2, column=i % 2, padx=5, pady=5, sticky='ew')
+        width = self._root_size()[0] - 180  # Subtract sidebar width
+        bucket = 2 if width > 1000 else 1 if width > 600 else 0
+
+        # Nothing to re-grid while the width stays within the same breakpoint
+        if bucket == self._header_layout_bucket:
+            return
+        self._header_layout_bucket = bucket
+
+        buttons = (self.start_button, self.pause_button, self.clear_chat_button, self.close_partnership_button)
+        positions = self.HEADER_LAYOUTS[bucket]
+
+        # Only the columns this layout uses share the width equally; unused
+        # ones must leave the uniform group or they would still claim a share
+        used = max(column for _, column in positions) + 1
+        self.header_frame.columnconfigure(tuple(range(used)), weight=1, uniform="hbtn")
+        if used < len(buttons):
+            self.header_frame.columnconfigure(tuple(range(used, len(buttons))), weight=0, uniform="")
+
+        # The first layout grids the buttons; later ones only move the buttons
+        # whose cell changed
+        placed = self._header_positions
+        if placed is None:
+            for btn, (row, column) in zip(buttons, positions):
+                btn.grid(row=row, column=column, padx=5, pady=5, sticky='ew')
         else:
-            # 4 rows, 1 column
-            self.header_frame.columnconfigure(0, weight=1)
-            for i, btn in enumerate(buttons):
-                btn.grid(row=i, column=0, padx=5, pady=5, sticky='ew')
+            for btn, old, new in zip(buttons, placed, positions):
+                if old != new:
+                    btn.grid_configure(row=new[0], column=new[1])
+        self._header_positions = positions
 
     def update_footer_layout(self):
         """
@@ -852,23 +822,63 @@ Note: This feature is under development."""
         """
         Handle window resize event.
 
-        Updates header and footer layouts when the main window is resized.
+        Coalesces the stream of <Configure> events fired while the window is
+        being dragged, so the layouts are only updated once the size settles.
 
         Args:
             event: Tkinter event object containing resize information.
         """
-        if event.widget == self.root:
-            self.update_header_layout()
-            self.update_footer_layout()
+        # Bindings on the root also fire for every descendant's <Configure>
+        if event.widget is not self.root:
+            return
+
+        size = (event.width, event.height)
+        if size == self._last_size:
+            return
+        last_width = self._last_size[0] if self._last_size else None
+        self._last_size = size
+
+        # The adaptive layouts only depend on width; height-only changes
+        # need no relayout
+        if event.width == last_width:
+            return
+
+        if self._resize_after_id:
+            self.root.after_cancel(self._resize_after_id)
+        self._resize_after_id = self.root.after(50, self._do_resize)
+
+    def _root_size(self):
+        """
+        Return the root window size as (width, height).
+
+        Uses the size recorded by on_resize and only queries Tk before the
+        first <Configure> event has arrived.
+        """
+        if self._last_size is not None:
+            return self._last_size
+        return self.root.winfo_width(), self.root.winfo_height()
+
+    def _do_resize(self):
+        """
+        Apply the adaptive layouts for the settled window size.
+        """
+        self._resize_after_id = None
+        self.update_header_layout()
+        self.update_footer_layout()
 
     def rebuild_ui(self):
         """
         Rebuild the UI based on view mode.
 
         Since view_mode is always 0 (expanded), this just ensures the layout is correct.
+        Nothing is destroyed; the window is only resized when the view mode
+        maps to a different geometry than the one already applied.
         """
-        # Set window size
-        self.root.geometry("800x760")
+        # Set window size only if it changed
+        new_geo = self.GEOMETRIES.get(self.view_mode, self.GEOMETRIES[0])
+        if new_geo != self._current_geo:
+            self.root.geometry(new_geo)
+            self._current_geo = new_geo
 
         # Footer is already gridded in setup_ui
         # self.footer_frame.grid(row=3, column=1, sticky=(tk.W, tk.E, tk.S), padx=UIStyles.SPACE_LG, pady=(0, 10))
@@ -883,59 +893,30 @@ Note: This feature is under development."""
         Updates the bot's auto language switching setting and logs the change.
         """
         enabled = self.auto_lang_var.get()
-        if hasattr(self, 'bot') and self.bot:
+        if self.bot:
             self.bot.auto_lang_switch = enabled
         self.log_message(f"Auto language switching {'enabled' if enabled else 'disabled'}", internal=True)
 
-    def on_translation_toggle(self):
+    def _make_toggle(self, var, bot_attr, label):
         """
-        Handle translation layer toggle.
+        Build a sidebar switch handler that mirrors a setting onto the bot.
 
-        Updates the bot's translation layer setting and logs the change.
-        """
-        enabled = self.use_translation_var.get()
-        if hasattr(self, 'bot') and self.bot:
-            self.bot.use_translation_layer = enabled
-            self.bot._save_hotkey_settings()
-        self.log_message(f"Translation layer {'enabled' if enabled else 'disabled'}", internal=True)
-
-        # Update switch colors
-        if enabled:
-            self.translation_layer_switch.configure(fg_color=UIStyles.HOVER_COLOR, progress_color=UIStyles.HOVER_COLOR)
-        else:
-            self.translation_layer_switch.configure(fg_color=UIStyles.DISABLED_COLOR, progress_color=UIStyles.DISABLED_COLOR)
+        The handler copies the switch value to the bot attribute, saves the
+        settings, logs the change and schedules the switch color refresh.
 
-    def on_hooker_toggle(self):
-        """
-        Handle hooker mod toggle.
-
-        Updates the bot's hooker mod setting and logs the change.
-        """
-        enabled = self.hooker_enabled_var.get()
-        if hasattr(self, 'bot') and self.bot:
-            self.bot.hooker_mod_enabled = enabled
-            self.bot._save_hotkey_settings()
-        self.log_message(f"Hooker Mod {'enabled' if enabled else 'disabled'}", internal=True)
+        Args:
+            var: Tk variable bound to the switch.
+            bot_attr (str): Bot attribute that holds the setting.
+            label (str): Setting name used in the log message.
 
-        # Update switch colors
-        if enabled:
-            self.hooker_switch.configure(fg_color=UIStyles.HOVER_COLOR, progress_color=UIStyles.HOVER_COLOR)
-        else:
-            self.hooker_switch.configure(fg_color=UIStyles.DISABLED_COLOR, progress_color=UIStyles.DISABLED_COLOR)
-    
-    def _update_start_button_state(self):
-        """
-        Update Start button state based on Ollama status.
-        
-        The Start button should be enabled only when Ollama is Running.
-        """
-        if hasattr(self, 'ollama_ui') and hasattr(self, 'start_button'):
-            if hasattr(self, 'status_manager'):
-                ollama_status = self.status_manager.get_ollama_status()
-                if ollama_status == "Running":
-                    self.start_button.configure(state="normal", fg_color=UIStyles.SUCCESS_COLOR, hover_color="#059669")
-                else:
-                    self.start_button.configure(state="disabled", fg_color=UIStyles.DISABLED_COLOR, hover_color=UIStyles.DISABLED_COLOR)
-            else:
-                # Fallback: disable if no status manager available
-                self.start_button.configure(state="disabled", fg_color=UIStyles.DISABLED_COLOR, hover_color=UIStyles.DISABLED_COLOR)
\ No newline at end of file
+        Returns:
+            callable: The switch command.
+        """
+        def handler():
+            enabled = var.get()
+            if self.bot:
+                setattr(self.bot, bot_attr, enabled)
+                self.bot._save_hotkey_settings()
+            self.log_message(f"{label} {'enabled' if enabled else 'disabled'}", internal=True)
+            self._schedule_switch_refresh()
+        return handler
@@ -9,7 +9,10 @@ Classes:
     ChatBotUI: Main UI class combining all UI mixins.
 """
 
+import sys
+import threading
 import tkinter as tk
+from tkinter import messagebox
 import customtkinter as ctk
 import keyboard
 from .bot import ChatBot
@@ -20,11 +23,7 @@ from .file_manager import FileManager
 from .ui_ollama import OllamaUI
 from .ui_character import UICharacterMixin
 from .ui_chat import UIChatMixin
-import time
-import traceback
-import json
 import os
-from .config import HOTKEY_PHRASES_FILE
 from .ui_styles import UIStyles
 from .ui_utils import UIUtilsMixin
 from .ui_handlers import UIHandlersMixin
@@ -32,10 +31,13 @@ from .ui_windows import UIWindowsMixin
 from .ui_init import UIInitMixin
 from .ui_hotkeys import HotkeyMixin as UIHotkeysMixin # Renamed for consistency with snippet
 from .ui_settings import SettingsMixin
-try:
-    import win32api
-except ImportError:
-    win32api = None
+
+# Win32 constants for the input language change hook
+_WM_INPUTLANGUAGECHANGE = 0x0051
+_GWLP_WNDPROC = -4
+_GA_ROOT = 2
+_ENGLISH_LANGID = 0x0409  # English (United States)
+_LAYOUT_POLL_MS = 500  # How often the Tk side checks for a layout change
 
 
 class ChatBotUI(UIUtilsMixin, UIHandlersMixin, UIWindowsMixin, UIInitMixin, UIHotkeysMixin, UICharacterMixin, UIChatMixin, SettingsMixin):
@@ -50,8 +52,7 @@ class ChatBotUI(UIUtilsMixin, UIHandlersMixin, UIWindowsMixin, UIInitMixin, UIHo
         root: Main Tkinter root window.
         bot: ChatBot instance.
         view_mode: UI view mode (always expanded).
-        hotkey_locks: Dictionary for hotkey debouncing.
-        is_processing: Dictionary for tracking processing states.
+        hotkey_locks: Dictionary for hotkey debouncing and processing state.
         autonomous_var: Boolean variable for autonomous mode.
         auto_lang_var: Boolean variable for auto language switching.
         hiwaifu_language_var: String variable for HiWaifu language.
@@ -59,10 +60,38 @@ class ChatBotUI(UIUtilsMixin, UIHandlersMixin, UIWindowsMixin, UIInitMixin, UIHo
 
     Methods:
         __init__: Initialize the UI.
+        _capture_hwnd: Record the window handle once the root is mapped.
+        _post_init_async: Start Ollama monitoring after the first frame.
         on_close: Handle window close event.
         _check_keyboard_layout: Check and warn about keyboard layout.
+        _current_hkl: Return the cached keyboard layout handle.
+        _install_layout_hook: Track input language changes on the root window.
+        _remove_layout_hook: Restore the original window procedure.
+        _poll_layout_change: Pick up layout changes flagged by the window procedure.
+        _on_layout_changed: Log a keyboard layout change.
+        _apply_start_button: Configure the Start button for the latest status.
+        _do_save: Write the settings file on a background thread.
     """
 
+    # Start button configuration per Ollama state, built once
+    START_BUTTON_RUNNING = {"state": "normal", "text": "Stop Ollama",
+                            "fg_color": UIStyles.SECONDARY_COLOR, "hover_color": UIStyles.ERROR_COLOR}
+    START_BUTTON_STOPPED = {"state": "normal", "text": "Start Ollama",
+                            "fg_color": UIStyles.SUCCESS_COLOR, "hover_color": "#059669"}
+    START_BUTTON_BUSY = {"state": "disabled", "text": "...",
+                         "fg_color": UIStyles.DISABLED_COLOR, "hover_color": UIStyles.DISABLED_COLOR}
+    START_BUTTON_UNAVAILABLE = {"state": "disabled", "text": "Start Ollama",
+                                "fg_color": UIStyles.DISABLED_COLOR, "hover_color": UIStyles.DISABLED_COLOR}
+    # Ollama status -> Start button state; other statuses (Not Installed,
+    # Checking, ...) leave the button unavailable
+    START_BUTTON_STATES = {
+        "Running": START_BUTTON_RUNNING,
+        "Stopped": START_BUTTON_STOPPED,
+        "Error": START_BUTTON_STOPPED,
+        "Starting": START_BUTTON_BUSY,
+        "Stopping": START_BUTTON_BUSY,
+    }
+
     def __init__(self, root):
         """
         Initialize the ChatBot UI.
@@ -78,9 +107,16 @@ class ChatBotUI(UIUtilsMixin, UIHandlersMixin, UIWindowsMixin, UIInitMixin, UIHo
         self.is_busy = False
         self.bot = None  # Initialize later
         self.hwnd = None
+        self._cached_hkl = None  # Keyboard layout handle, read once via _current_hkl
+        # Window procedure subclass that tracks keyboard layout changes
+        self._wndproc = None
+        self._old_wndproc = None
+        self._wndproc_hwnd = None
+        self._layout_changed = False  # Set by the window procedure only
+        self._layout_poll_id = None
         self.last_toggle_time = 0
         self.hotkey_locks = {}
-        self.is_processing = {}
+        self._lang_handlers = {}  # Filled by setup_hotkeys
         self.global_prompt_var = None
         self.autonomous_var = ctk.BooleanVar(value=False)
         self.hiwaifu_language_var = tk.StringVar(value="en")
@@ -93,53 +129,94 @@ class ChatBotUI(UIUtilsMixin, UIHandlersMixin, UIWindowsMixin, UIInitMixin, UIHo
         self.current_status = "Not Running"
         self.scanning_status = ""
         self._dots_count = 0
+        self._pending_save = None  # after() id of a debounced settings write
+        self._switch_refresh_pending = False
+        self._pending_status = None  # Latest Ollama status for the Start button
+        self._start_button_state = None  # Last state applied to the Start button
+        self._status_after_id = None  # after() id of the pending Start button update
+        self._save_after_id = None  # after() id of a debounced active model save
+        self._save_thread = None  # Settings write in flight, joined on close
+        self._switch_states = {}  # Last on/off state applied to each sidebar switch
         self.icon_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'resources', 'logo.ico')
+        # Collapsible sections are created in setup_ui; None until then
+        self.nicks_content_frame = None
+        self.logs_content_frame = None
+        self._nicks_built = False  # Nick list cards are built on first expand
+        self._game_sync_overlay_btn = None  # Created with the Game Sync view
+        self._view_cache = {}  # Secondary view frames, built on first visit
+        self._active_view_widget = None  # View frame currently on top of the view stack
         
         # Ollama integration
         self.file_manager = FileManager()
+        # The Ollama directories do not depend on the UI; create them while
+        # the widgets are being built
+        self._fs_thread = threading.Thread(target=self.file_manager.create_ollama_directories, daemon=True)
+        self._fs_thread.start()
         self.status_manager = StatusManager()
         self.download_manager = DownloadManager()
         self.ollama_manager = OllamaManager(self.file_manager, self.download_manager, self.status_manager)
         self.ollama_ui = OllamaUI(self.root, self.ollama_manager, self.status_manager, self.file_manager, self.download_manager)
 
-        # Configure modern styles
+        # Configure modern styles; the root background can wait until after
+        # the first frame
         UIStyles.configure_styles()
-        UIStyles.apply_to_root(self.root)
+        self.root.after_idle(UIStyles.apply_to_root, self.root)
 
         self.setup_ui()
         self.bot = ChatBot(self)  # Initialize bot after UI setup
         self.load_settings()  # Bot is now available
-        # Sync UI variables with bot settings
-        self.use_translation_var.set(getattr(self.bot, 'use_translation_layer', False))
-        self.autonomous_var.set(getattr(self.bot, 'autonomous_mode', False))
-        self.hooker_enabled_var.set(getattr(self.bot, 'hooker_mod_enabled', False))
+        # Sync UI variables with bot settings (load_settings already synced
+        # autonomous mode and the translation layer)
+        self.hooker_enabled_var.set(self.bot.hooker_mod_enabled)
         self.update_switch_colors()
 
-        # Initialize Ollama system
-        self.file_manager.create_ollama_directories()
+        # Ollama monitoring and detection start once the window has been drawn
+        self.root.after_idle(self._post_init_async)
+
+        # Check keyboard layout and warn if not English, once the window is up
+        self.root.after_idle(self._check_keyboard_layout)
+
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.setup_hotkeys()
+        # Keep the window above the game, applied after the first frame
+        self.root.after_idle(self.root.attributes, "-topmost", True)
+        # The window handle is read once the root is mapped, instead of
+        # forcing an update_idletasks() flush here
+        self._map_bind_id = self.root.bind("<Map>", self._capture_hwnd, add="+")
+
+    def _capture_hwnd(self, event):
+        """
+        Record the root window handle the first time the root is mapped.
+
+        Args:
+            event: Tkinter <Map> event.
+        """
+        # Root bindings also fire for every descendant being mapped
+        if event.widget is not self.root:
+            return
+        self.hwnd = self.root.winfo_id()
+        self.root.unbind("<Map>", self._map_bind_id)
+        self._install_layout_hook()
+
+    def _post_init_async(self):
+        """
+        Start Ollama monitoring and detection after the first frame.
+
+        Registers the status callbacks, starts the status monitor and runs
+        Ollama detection on a background thread.
+        """
+        # Detection expects the Ollama directories created during setup
+        self._fs_thread.join()
         self.status_manager.start_monitoring()
-        
+
         # Add callback for Ollama status changes to update Start button
         self.status_manager.add_callback('ollama_status', self._on_ollama_status_changed)
         # Add callback for active model change to save it
         self.status_manager.add_callback('active_model', self._on_active_model_changed_persistence)
-        
+
         # Start Ollama detection in background
-        import threading
         threading.Thread(target=self.ollama_manager.detect_ollama, daemon=True).start()
 
-        # Check keyboard layout and warn if not English
-        self._check_keyboard_layout()
-
-        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
-        self.setup_hotkeys()
-        self.root.attributes("-topmost", True)
-        self.hwnd = self.root.winfo_id()
-        if self.hwnd == 0:
-            self.root.update_idletasks()
-            self.hwnd = self.root.winfo_id()
-
-
     def on_close(self):
         """
         Handle window close event.
@@ -147,8 +224,21 @@ class ChatBotUI(UIUtilsMixin, UIHandlersMixin, UIWindowsMixin, UIInitMixin, UIHo
         Unhooks all hotkeys, stops the bot if running, and destroys the window.
         """
         keyboard.unhook_all()
+        self.ollama_manager.cancel_detection()
+        # Wake and join the status monitor instead of leaving it mid-sleep
+        self.status_manager.stop_monitoring()
+        if self._pending_save:
+            self.root.after_cancel(self._pending_save)
+            self._flush_autonomous_save()
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+            self.bot.save_settings()
+        # Let a background settings write finish before the process exits
+        if self._save_thread is not None:
+            self._save_thread.join()
         if self.bot and self.bot.bot_running:
             self.bot.stop_bot(wait=False)
+        self._remove_layout_hook()
         self.root.destroy()
 
     def _check_keyboard_layout(self):
@@ -158,28 +248,123 @@ class ChatBotUI(UIUtilsMixin, UIHandlersMixin, UIWindowsMixin, UIInitMixin, UIHo
         Uses win32api to detect the current keyboard layout and shows a warning
         if it's not English, as text insertion may not work correctly otherwise.
         """
-        if win32api is None:
+        # Keyboard layouts are only checked on Windows
+        if sys.platform != "win32":
+            return
+
+        # Imported here: only the layout check needs pywin32
+        try:
+            import win32api
+        except ImportError:
             self.log_message("Failed to import win32api for keyboard layout check.", internal=True)
             return
 
         try:
-            current_layout = win32api.GetKeyboardLayout(0) & 0xFFFF
-            english_layout = 0x0409  # English (United States)
+            current_layout = self._current_hkl() & 0xFFFF
 
-            if current_layout != english_layout:
+            if current_layout != _ENGLISH_LANGID:
                 message = (
                     "Warning: Current keyboard layout is not English.\n\n"
                     "Text insertion into HiWaifu may not work correctly with non-English layout.\n"
                     "It is recommended to switch to English (EN) layout for proper bot operation.\n\n"
                     "You can continue, but text insertion functionality may be limited."
                 )
-                tk.messagebox.showwarning("Keyboard Layout Warning", message)
+                # The modal dialog is shown on a later idle pass so it does not
+                # hold up the rest of this callback
+                self.root.after_idle(messagebox.showwarning, "Keyboard Layout Warning", message)
                 self.log_message("Non-English keyboard layout detected. Text insertion may work incorrectly.", internal=True)
             else:
                 self.log_message("Keyboard layout is English - text insertion should work correctly.", internal=True)
         except Exception as e:
             self.log_message(f"Error checking keyboard layout: {e}", internal=True)
     
+    def _current_hkl(self):
+        """
+        Return the keyboard layout handle of the UI thread.
+
+        The value is queried from Windows once and cached; it is refreshed
+        only when the input language changes.
+        """
+        if self._cached_hkl is None:
+            import win32api
+            self._cached_hkl = win32api.GetKeyboardLayout(0)
+        return self._cached_hkl
+
+    def _install_layout_hook(self):
+        """
+        Subclass the root window procedure to catch input language changes.
+
+        WM_INPUTLANGUAGECHANGE carries the new keyboard layout handle, so the
+        cached layout stays current without polling GetKeyboardLayout. The
+        original window procedure is always chained to.
+        """
+        if sys.platform != "win32":
+            return
+        try:
+            import ctypes
+            from ctypes import wintypes
+
+            user32 = ctypes.windll.user32
+            lresult = ctypes.c_ssize_t
+            wndproc_type = ctypes.WINFUNCTYPE(lresult, wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM)
+            user32.CallWindowProcW.restype = lresult
+            user32.CallWindowProcW.argtypes = (ctypes.c_void_p, wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM)
+            user32.SetWindowLongPtrW.restype = ctypes.c_void_p
+            user32.SetWindowLongPtrW.argtypes = (wintypes.HWND, ctypes.c_int, ctypes.c_void_p)
+            user32.GetAncestor.restype = wintypes.HWND
+            user32.GetAncestor.argtypes = (wintypes.HWND, wintypes.UINT)
+
+            # The message goes to the top-level frame, not Tk's client window
+            hwnd = user32.GetAncestor(self.hwnd, _GA_ROOT) or self.hwnd
+
+            # Runs inside Tk's event dispatch; calling back into Tcl from here
+            # corrupts tkinter's thread state, so it only records the change
+            def wndproc(hwnd, msg, wparam, lparam):
+                if msg == _WM_INPUTLANGUAGECHANGE:
+                    self._cached_hkl = lparam
+                    self._layout_changed = True
+                return user32.CallWindowProcW(self._old_wndproc, hwnd, msg, wparam, lparam)
+
+            # Keep the callback alive for as long as the window uses it
+            self._wndproc = wndproc_type(wndproc)
+            self._old_wndproc = user32.SetWindowLongPtrW(hwnd, _GWLP_WNDPROC, ctypes.cast(self._wndproc, ctypes.c_void_p))
+            self._wndproc_hwnd = hwnd
+            self._layout_poll_id = self.root.after(_LAYOUT_POLL_MS, self._poll_layout_change)
+        except Exception as e:
+            self._wndproc = None
+            self.log_message(f"Keyboard layout change hook unavailable: {e}", internal=True)
+
+    def _remove_layout_hook(self):
+        """
+        Restore the original root window procedure.
+        """
+        if self._layout_poll_id is not None:
+            self.root.after_cancel(self._layout_poll_id)
+            self._layout_poll_id = None
+        if self._wndproc_hwnd is None:
+            return
+        import ctypes
+        ctypes.windll.user32.SetWindowLongPtrW(self._wndproc_hwnd, _GWLP_WNDPROC, self._old_wndproc)
+        self._wndproc_hwnd = None
+
+    def _poll_layout_change(self):
+        """
+        Log a layout change flagged by the window procedure, then reschedule.
+        """
+        if self._layout_changed:
+            self._layout_changed = False
+            self._on_layout_changed()
+        self._layout_poll_id = self.root.after(_LAYOUT_POLL_MS, self._poll_layout_change)
+
+    def _on_layout_changed(self):
+        """
+        Log whether the newly selected keyboard layout suits text insertion.
+        """
+        if (self._cached_hkl & 0xFFFF) != _ENGLISH_LANGID:
+            self.log_message("Keyboard layout changed to non-English. Text insertion may work incorrectly.", internal=True)
+        else:
+            self.log_message("Keyboard layout changed to English.", internal=True)
+
     def _on_ollama_status_changed(self, new_status, old_status):
         """
         Handle Ollama status changes.
@@ -187,45 +372,52 @@ class ChatBotUI(UIUtilsMixin, UIHandlersMixin, UIWindowsMixin, UIInitMixin, UIHo
         Updates the Start button state based on Ollama status.
         """
         if hasattr(self, 'start_button'):
+            # The button update runs on the Tk thread and reads the latest
+            # status; a burst of transitions shares one pending update
+            self._pending_status = new_status
+            if self._status_after_id is None:
+                self._status_after_id = self.root.after(50, self._apply_start_button)
+
+            bot = self.bot
+            bot_running = bool(bot and bot.bot_running)
             if new_status == "Running":
-                self.root.after(0, lambda: self.start_button.configure(
-                    state="normal", 
-                    text="Stop Ollama",
-                    fg_color=UIStyles.SECONDARY_COLOR, 
-                    hover_color=UIStyles.ERROR_COLOR
-                ))
                 # Automatically start bot when Ollama is running
-                if self.bot and not self.bot.bot_running:
-                    self.bot.start_bot()
-            elif new_status == "Stopped" or new_status == "Error":
-                self.root.after(0, lambda: self.start_button.configure(
-                    state="normal", 
-                    text="Start Ollama",
-                    fg_color=UIStyles.SUCCESS_COLOR, 
-                    hover_color="#059669"
-                ))
+                if bot and not bot_running:
+                    bot.start_bot()
+            elif new_status in ("Stopped", "Error", "Not Installed"):
                 # Automatically stop bot when Ollama is not running
-                if self.bot and self.bot.bot_running:
-                    self.bot.stop_bot()
-            elif new_status == "Not Installed":
-                self.root.after(0, lambda: self.start_button.configure(
-                    state="disabled", 
-                    text="Start Ollama",
-                    fg_color=UIStyles.DISABLED_COLOR, 
-                    hover_color=UIStyles.DISABLED_COLOR
-                ))
-                if self.bot and self.bot.bot_running:
-                    self.bot.stop_bot()
-            else: # Starting, Stopping, Checking, etc.
-                self.root.after(0, lambda: self.start_button.configure(
-                    state="disabled", 
-                    text="..." if new_status in ["Starting", "Stopping"] else "Start Ollama",
-                    fg_color=UIStyles.DISABLED_COLOR, 
-                    hover_color=UIStyles.DISABLED_COLOR
-                ))
+                if bot_running:
+                    bot.stop_bot()
+
+    def _apply_start_button(self):
+        """
+        Configure the Start button for the most recent Ollama status.
+        """
+        self._status_after_id = None
+        button_state = self.START_BUTTON_STATES.get(self._pending_status, self.START_BUTTON_UNAVAILABLE)
+
+        # Skip the configure (and CTk canvas redraw) when the state is unchanged;
+        # "Stopped" and "Error" share one state, so compare the state dicts
+        if button_state is self._start_button_state:
+            return
+        self._start_button_state = button_state
+        self.start_button.configure(**button_state)
 
     def _on_active_model_changed_persistence(self, new_model, old_model):
         """Handle active model changes for persistence."""
-        if self.bot:
-            self.bot.active_model = new_model
-            self.bot.save_settings()
+        bot = self.bot
+        if bot is None:
+            return
+        bot.active_model = new_model
+        # Coalesce model switches into one settings write once they settle
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+        self._save_after_id = self.root.after(500, self._do_save)
+
+    def _do_save(self):
+        """
+        Write the settings file on a background thread.
+        """
+        self._save_after_id = None
+        self._save_thread = threading.Thread(target=self.bot.save_settings, daemon=True)
+        self._save_thread.start()
@@ -11,8 +11,10 @@ import tkinter as tk
 from tkinter import messagebox
 import customtkinter as ctk
 from typing import Optional, Callable
+from functools import lru_cache
 import threading
 import time
+import logging
 
 from .ollama_manager import OllamaManager
 from .status_manager import StatusManager
@@ -20,6 +22,20 @@ from .file_manager import FileManager
 from .download_manager import DownloadManager
 from .ui_styles import UIStyles
 
+# Byte unit thresholds
+_KB, _MB, _GB = 1 << 10, 1 << 20, 1 << 30
+
+# Minimum seconds between progress bar repaints (10 Hz)
+_PROGRESS_INTERVAL = 0.1
+
+
+@lru_cache(maxsize=256)
+def _format_kilobytes(kb: int) -> str:
+    """Format a size given in whole KB as MB or GB."""
+    if kb >= _MB:
+        return f"{kb / _MB:.1f} GB"
+    return f"{kb / _KB:.1f} MB"
+
 
 class OllamaUI:
     """
@@ -33,8 +49,101 @@ class OllamaUI:
         status_manager: StatusManager instance.
         file_manager: FileManager instance.
         download_manager: DownloadManager instance.
+        logger: Logger instance for logging operations.
     """
     
+    # Fixed attribute layout; every attribute assigned on self must be listed
+    __slots__ = (
+        # Managers
+        'parent', 'ollama_manager', 'status_manager', 'file_manager',
+        'download_manager', 'logger',
+        # Dashboard widgets
+        'status_label', 'status_indicator', 'active_model_label',
+        'active_char_label', 'char_sync_label',
+        # AI Setup widgets
+        'ai_status_label', 'ai_service_btn', 'ai_action_btn',
+        'ollama_progress_frame', 'ollama_progress_label', 'ollama_progress_bar',
+        'setup_active_model_label', 'setup_char_sync_label', 'model_input',
+        'download_model_btn', 'model_dropdown', 'activate_model_btn',
+        'delete_model_btn', 'model_progress_frame', 'model_progress_title',
+        'model_progress_label', 'model_progress_bar', 'install_path_label',
+        'storage_label', 'update_label', 'download_progress', 'download_status',
+        # Label variables
+        'status_var', 'ai_status_var', 'active_model_var',
+        'setup_active_model_var', 'active_char_var', 'ollama_progress_var',
+        'model_progress_var',
+        # Update scheduling state
+        '_pending_status', '_status_update_scheduled', '_refresh_running',
+        '_model_names', '_button_states',
+        '_pending_progress', '_progress_scheduled', '_last_progress_paint',
+        '_profile_update_scheduled',
+    )
+    
+    # (progress bar, progress text variable) attribute names per download kind
+    PROGRESS_WIDGETS = {
+        'ollama': ('ollama_progress_bar', 'ollama_progress_var'),
+        'model': ('model_progress_bar', 'model_progress_var'),
+    }
+    
+    # Status indicator color per Ollama status
+    STATUS_COLORS = {
+        "Stopped": "#94a3b8", # Neutral grey-blue
+        "Not Installed": "#ef4444",
+        "Starting": "#f59e0b",
+        "Running": "#10b981",
+        "Error": "#ef4444",
+        "Downloading": "#3b82f6",
+        "Installing": "#8b5cf6"
+    }
+    
+    # (service button, action button) options per Ollama status
+    BUTTON_STATES = {
+        "Not Installed": (
+            {"state": "disabled", "text": "ON", "fg_color": UIStyles.SUCCESS_COLOR},
+            {"state": "normal", "text": "Download Ollama"},
+        ),
+        "Stopped": (
+            {"state": "normal", "text": "ON", "fg_color": UIStyles.SUCCESS_COLOR,
+             "hover_color": UIStyles.PRIMARY_HOVER},
+            {"state": "normal", "text": "Delete Ollama"},
+        ),
+        "Running": (
+            {"state": "normal", "text": "OFF", "fg_color": UIStyles.SECONDARY_COLOR,
+             "hover_color": UIStyles.ERROR_COLOR},
+            {"state": "normal", "text": "Delete Ollama"},
+        ),
+        "Checking": (
+            {"state": "disabled", "text": "..."},
+            {"state": "disabled"},
+        ),
+        "Downloading": (
+            {"state": "disabled", "text": "ON"},
+            {"state": "disabled", "text": "Downloading..."},
+        ),
+        "Installing": (
+            {"state": "disabled", "text": "ON"},
+            {"state": "disabled", "text": "Installing..."},
+        ),
+        "Starting": (
+            {"state": "disabled", "text": "..."},
+            {"state": "disabled", "text": "Delete Ollama"},
+        ),
+        "Stopping": (
+            {"state": "disabled", "text": "..."},
+            {"state": "disabled", "text": "Delete Ollama"},
+        ),
+        # Error with the Ollama binary present; without it the
+        # "Not Installed" options apply
+        "Error": (
+            {"state": "normal", "text": "ON", "fg_color": UIStyles.SUCCESS_COLOR},
+            {"state": "normal", "text": "Delete Ollama"},
+        ),
+    }
+    BUTTON_STATES_UNKNOWN = (
+        {"state": "disabled", "text": "Checking..."},
+        {"state": "disabled"},
+    )
+    
     def __init__(self, parent, ollama_manager: OllamaManager, status_manager: StatusManager, 
                  file_manager: FileManager, download_manager: DownloadManager):
         """
@@ -52,6 +161,7 @@ class OllamaUI:
         self.status_manager = status_manager
         self.file_manager = file_manager
         self.download_manager = download_manager
+        self.logger = logging.getLogger(__name__)
         
         # UI components
         self.status_label = None
@@ -62,42 +172,73 @@ class OllamaUI:
         self.model_dropdown = None
         self.active_char_label = None
         self.char_sync_label = None
+        # AI Setup widgets, created with the AI Setup zones
+        self.ai_status_label = None
+        self.ai_service_btn = None
+        self.ai_action_btn = None
+        self.setup_active_model_label = None
+        self.setup_char_sync_label = None
+        self.model_input = None
+        self.activate_model_btn = None
+        self.delete_model_btn = None
+        
+        # Text of the frequently updated labels; set() needs no widget
+        # lookup and keeps the text current even before a view is built
+        self.status_var = tk.StringVar(master=parent, value="Checking...")
+        self.ai_status_var = tk.StringVar(master=parent, value="Status: Checking...")
+        self.active_model_var = tk.StringVar(master=parent, value="None")
+        self.setup_active_model_var = tk.StringVar(master=parent, value=" (Active: None)")
+        self.active_char_var = tk.StringVar(master=parent, value="None")
+        self.ollama_progress_var = tk.StringVar(master=parent, value="0%")
+        self.model_progress_var = tk.StringVar(master=parent, value="0%")
+        
+        # Latest Ollama status waiting for the next idle UI pass
+        self._pending_status = None
+        self._status_update_scheduled = False
+        
+        # Set while a model list refresh thread is running
+        self._refresh_running = False
+        self._model_names = ()  # Values last applied to the model dropdown
+        
+        # Latest download progress per PROGRESS_WIDGETS key and repaint throttling
+        self._pending_progress = {}
+        self._progress_scheduled = False
+        self._last_progress_paint = 0.0
+        
+        # BUTTON_STATES entry last applied to the AI Setup buttons
+        self._button_states = None
+        
+        # Pending idle refresh of the active model/profile labels
+        self._profile_update_scheduled = False
         
         # Bind status callbacks
         self.status_manager.add_callback('ollama_status', self._on_ollama_status_change)
-        self.status_manager.add_callback('active_model', self._on_active_model_change)
-        self.status_manager.add_callback('active_character', self._on_active_character_change)
-        self.status_manager.add_callback('character_sync', self._on_character_sync_change)
+        for key in ('active_model', 'active_character', 'character_sync'):
+            self.status_manager.add_callback(key, self._on_profile_state_change)
     
     def format_bytes(self, b: int) -> str:
         """Format bytes to human readable format."""
-        if b < 1024:
-            return f"{b} B"
-        elif b < 1024 * 1024:
-            return f"{b / 1024:.1f} KB"
-        elif b < 1024 * 1024 * 1024:
-            return f"{b / (1024 * 1024):.1f} MB"
-        else:
-            return f"{b / (1024 * 1024 * 1024):.1f} GB"
+        if b >= _MB:
+            # Sub-KB differences are invisible at MB/GB precision, so quantize
+            # to whole KB and let successive progress ticks hit the cache
+            return _format_kilobytes(int(b) >> 10)
+        if b >= _KB:
+            return f"{b / _KB:.1f} KB"
+        return f"{b} B"
     
     def create_dashboard_zone(self, parent):
         """Create Ollama status zone for Dashboard - compact version without control buttons."""
+        SM, MD, LG, XXL, FONT_NORMAL, TEXT_PRIMARY, TEXT_TERTIARY = (
+            UIStyles.SPACE_SM, UIStyles.SPACE_MD, UIStyles.SPACE_LG,
+            UIStyles.SPACE_2XL, UIStyles.FONT_NORMAL, UIStyles.TEXT_PRIMARY,
+            UIStyles.TEXT_TERTIARY
+        )
         # Main container
         ollama_zone = UIStyles.create_card_frame(parent)
         # Note: This will be gridded by the parent, not packed
         
         # Zone header
-        zone_header = ctk.CTkFrame(ollama_zone, fg_color="transparent")
-        zone_header.pack(fill='x', padx=UIStyles.SPACE_2XL, pady=(UIStyles.SPACE_2XL, UIStyles.SPACE_MD))
-        
-        # Title
-        title = ctk.CTkLabel(
-            zone_header,
-            text="Ollama Status",
-            font=UIStyles.FONT_TITLE,
-            text_color=UIStyles.TEXT_PRIMARY
-        )
-        title.pack(side='left')
+        zone_header = self._create_zone_header(ollama_zone, "Ollama Status", row=True)
         
         # Status indicator and text
         status_frame = ctk.CTkFrame(zone_header, fg_color="transparent")
@@ -109,55 +250,55 @@ class OllamaUI:
             font=(UIStyles.FONT_FAMILY, 20),
             text_color="#f59e0b"
         )
-        self.status_indicator.pack(side='left', padx=(0, UIStyles.SPACE_SM))
+        self.status_indicator.pack(side='left', padx=(0, SM))
         
         self.status_label = ctk.CTkLabel(
             status_frame,
-            text="Checking...",
-            font=UIStyles.FONT_NORMAL,
+            textvariable=self.status_var,
+            font=FONT_NORMAL,
             text_color=UIStyles.TEXT_SECONDARY
         )
         self.status_label.pack(side='left')
         
         # Active model info
         model_info = ctk.CTkFrame(ollama_zone, fg_color="transparent")
-        model_info.pack(fill='x', padx=UIStyles.SPACE_2XL, pady=(0, UIStyles.SPACE_LG))
+        model_info.pack(fill='x', padx=XXL, pady=(0, LG))
         
         model_text = ctk.CTkLabel(
             model_info,
             text="Active Model:",
-            font=UIStyles.FONT_NORMAL,
-            text_color=UIStyles.TEXT_TERTIARY
+            font=FONT_NORMAL,
+            text_color=TEXT_TERTIARY
         )
         model_text.pack(side='left')
         
         self.active_model_label = ctk.CTkLabel(
             model_info,
-            text="None",
-            font=UIStyles.FONT_NORMAL,
-            text_color=UIStyles.TEXT_PRIMARY
+            textvariable=self.active_model_var,
+            font=FONT_NORMAL,
+            text_color=TEXT_PRIMARY
         )
-        self.active_model_label.pack(side='left', padx=(UIStyles.SPACE_SM, 0))
+        self.active_model_label.pack(side='left', padx=(SM, 0))
         
         # Character Profile info (New)
         char_info = ctk.CTkFrame(ollama_zone, fg_color="transparent")
-        char_info.pack(fill='x', padx=UIStyles.SPACE_2XL, pady=(0, UIStyles.SPACE_LG))
+        char_info.pack(fill='x', padx=XXL, pady=(0, LG))
         
         char_text = ctk.CTkLabel(
             char_info,
             text="Active Profile:",
-            font=UIStyles.FONT_NORMAL,
-            text_color=UIStyles.TEXT_TERTIARY
+            font=FONT_NORMAL,
+            text_color=TEXT_TERTIARY
         )
         char_text.pack(side='left')
         
         self.active_char_label = ctk.CTkLabel(
             char_info,
-            text="None",
-            font=UIStyles.FONT_NORMAL,
+            textvariable=self.active_char_var,
+            font=FONT_NORMAL,
             text_color=UIStyles.PRIMARY_COLOR
         )
-        self.active_char_label.pack(side='left', padx=(UIStyles.SPACE_SM, 0))
+        self.active_char_label.pack(side='left', padx=(SM, 0))
 
         self.char_sync_label = ctk.CTkLabel(
             char_info,
@@ -165,113 +306,134 @@ class OllamaUI:
             font=UIStyles.FONT_SMALL,
             text_color="#94a3b8" # Muted slate
         )
-        self.char_sync_label.pack(side='left', padx=(UIStyles.SPACE_MD, 0))
+        self.char_sync_label.pack(side='left', padx=(MD, 0))
 
-        # Trigger initial status sync
-        current_status = self.status_manager.get_ollama_status()
-        self._on_ollama_status_change(current_status, "")
-        
-        # Initial character sync
-        current_char = self.status_manager.get_active_character()
-        if current_char:
-            self._on_active_character_change(current_char, None)
-        
         return ollama_zone
     
+    def _create_zone_header(self, zone, text, row=False):
+        """
+        Create the title of a zone card.
+
+        A title that stands alone is packed straight into the card. With
+        row=True the title is placed in a transparent row frame, which is
+        returned so more header widgets can be packed next to it.
+        """
+        XXL = UIStyles.SPACE_2XL
+        pady = (XXL, UIStyles.SPACE_MD)
+        title_kw = {'text': text, 'font': UIStyles.FONT_TITLE, 'text_color': UIStyles.TEXT_PRIMARY}
+        if not row:
+            title = ctk.CTkLabel(zone, **title_kw)
+            title.pack(anchor='w', padx=XXL, pady=pady)
+            return title
+
+        header = ctk.CTkFrame(zone, fg_color="transparent")
+        header.pack(fill='x', padx=XXL, pady=pady)
+        ctk.CTkLabel(header, **title_kw).pack(side='left')
+        return header
+
+    def sync_initial_state(self):
+        """
+        Apply the current status manager state to the UI once.
+
+        Called after the dashboard zone is built; views built later pick the
+        state up from the shared StringVars.
+        """
+        self._on_ollama_status_change(self.status_manager.get_ollama_status(), "")
+        self._flush_profile_state()
+
     def create_ai_setup_zones(self, parent):
         """Create all zones for AI Setup page."""
         zones = {}
-        
-        # Zone 1: Ollama Management
-        zones['ollama_management'] = self._create_ollama_management_zone(parent)
-        
-        # Zone 2: Download Progress - REMOVED, progress bars are now inline
-        # zones['download_progress'] = self._create_download_progress_zone(parent)
-        
-        # Zone 3: Model Management
-        zones['model_management'] = self._create_model_management_zone(parent)
-        
-        # Zone 4: System Information
-        zones['system_info'] = self._create_system_info_zone(parent)
-        
+        for step in self.ai_setup_zone_steps(parent, zones):
+            step()
         return zones
+
+    def ai_setup_zone_steps(self, parent, zones):
+        """
+        Return one callable per AI Setup zone, in display order.
+
+        Each callable builds its zone into parent and stores it in zones, so
+        callers can build the zones all at once or spread them over idle ticks.
+        """
+        # Zone 2 (Download Progress) was REMOVED, progress bars are now inline
+        builders = (
+            ('ollama_management', self._create_ollama_management_zone),   # Zone 1
+            ('model_management', self._create_model_management_zone),     # Zone 3
+            ('system_info', self._create_system_info_zone),               # Zone 4
+        )
+        return [lambda key=key, build=build: zones.__setitem__(key, build(parent))
+                for key, build in builders]
     
     def _create_ollama_management_zone(self, parent):
         """Create Ollama management zone."""
+        MD, LG, XXL, FONT_TITLE, FONT_NORMAL, TEXT_PRIMARY = (
+            UIStyles.SPACE_MD, UIStyles.SPACE_LG, UIStyles.SPACE_2XL,
+            UIStyles.FONT_TITLE, UIStyles.FONT_NORMAL, UIStyles.TEXT_PRIMARY
+        )
         zone = UIStyles.create_card_frame(parent)
-        zone.pack(fill='x', padx=UIStyles.SPACE_2XL, pady=UIStyles.SPACE_LG)
         
         # Header
-        header = ctk.CTkFrame(zone, fg_color="transparent")
-        header.pack(fill='x', padx=UIStyles.SPACE_2XL, pady=(UIStyles.SPACE_2XL, UIStyles.SPACE_MD))
-        
-        title = ctk.CTkLabel(
-            header,
-            text="Ollama Management",
-            font=UIStyles.FONT_TITLE,
-            text_color=UIStyles.TEXT_PRIMARY
-        )
-        title.pack(side='left')
+        self._create_zone_header(zone, "Ollama Management")
         
         # Status display
         status_frame = ctk.CTkFrame(zone, fg_color="transparent")
-        status_frame.pack(fill='x', padx=UIStyles.SPACE_2XL, pady=(0, UIStyles.SPACE_LG))
+        status_frame.pack(fill='x', padx=XXL, pady=(0, LG))
         
         self.ai_status_label = ctk.CTkLabel(
             status_frame,
-            text="Status: Checking...",
-            font=UIStyles.FONT_TITLE,
-            text_color=UIStyles.TEXT_PRIMARY
+            textvariable=self.ai_status_var,
+            font=FONT_TITLE,
+            text_color=TEXT_PRIMARY
         )
         self.ai_status_label.pack(anchor='w')
         
-        # Action buttons
+        # Action buttons, gridded in one row
         action_frame = ctk.CTkFrame(zone, fg_color="transparent")
-        action_frame.pack(fill='x', padx=UIStyles.SPACE_2XL, pady=(0, UIStyles.SPACE_2XL))
-        
-        # Row 1
-        row1 = ctk.CTkFrame(action_frame, fg_color="transparent")
-        row1.pack(fill='x', pady=(0, UIStyles.SPACE_MD))
+        action_frame.pack(fill='x', padx=XXL, pady=(0, XXL))
         
         # Combined Action Button (Download/Delete)
         self.ai_action_btn = UIStyles.create_button(
-            row1,
+            action_frame,
             text="Download Ollama",
             command=self._on_action_click,
             width=140
         )
-        self.ai_action_btn.pack(side='left', padx=(0, UIStyles.SPACE_MD))
+        self.ai_action_btn.grid(row=0, column=0, sticky='w', padx=(0, MD), pady=(0, MD))
         
         # Combined Service Button (Start/Stop)
         self.ai_service_btn = UIStyles.create_button(
-            row1,
+            action_frame,
             text="Start Service",
             command=self._on_service_toggle_click,
             state="disabled",
             width=120
         )
-        self.ai_service_btn.pack(side='left', padx=(0, UIStyles.SPACE_MD))
+        self.ai_service_btn.grid(row=0, column=1, sticky='w', padx=(0, MD), pady=(0, MD))
         
         # Removed redundant Row 2 buttons, consolidated into Row 1
         # Progress Section (Hidden by default)
         self.ollama_progress_frame = ctk.CTkFrame(zone, fg_color="transparent")
-        self.ollama_progress_frame.pack(fill='x', padx=UIStyles.SPACE_2XL, pady=(0, UIStyles.SPACE_2XL))
+        self.ollama_progress_frame.pack(fill='x', padx=XXL, pady=(0, XXL))
         self.ollama_progress_frame.pack_forget() # Hide initially
 
         progress_header = ctk.CTkFrame(self.ollama_progress_frame, fg_color="transparent")
         progress_header.pack(fill='x', pady=(0, 5))
         
-        ctk.CTkLabel(progress_header, text="Downloading Ollama...", font=UIStyles.FONT_NORMAL, text_color=UIStyles.TEXT_SECONDARY).pack(side='left')
-        self.ollama_progress_label = ctk.CTkLabel(progress_header, text="0%", font=UIStyles.FONT_NORMAL, text_color=UIStyles.TEXT_PRIMARY)
+        ctk.CTkLabel(progress_header, text="Downloading Ollama...", font=FONT_NORMAL, text_color=UIStyles.TEXT_SECONDARY).pack(side='left')
+        self.ollama_progress_label = ctk.CTkLabel(progress_header, textvariable=self.ollama_progress_var, font=FONT_NORMAL, text_color=TEXT_PRIMARY)
         self.ollama_progress_label.pack(side='right')
 
         self.ollama_progress_bar = ctk.CTkProgressBar(self.ollama_progress_frame, height=10, progress_color=UIStyles.PRIMARY_COLOR)
         self.ollama_progress_bar.pack(fill='x')
         self.ollama_progress_bar.set(0)
 
-        # Trigger initial status sync
-        current_status = self.status_manager.get_ollama_status()
-        self._on_ollama_status_change(current_status, "")
+        # The status label is bound to ai_status_var; only the buttons need
+        # the current status applied
+        self._update_button_states(self.status_manager.get_ollama_status())
+
+        # Pack the finished card once so building its children does not
+        # resize the already-mapped page on every child pack
+        zone.pack(fill='x', padx=XXL, pady=LG)
 
         return zone
     
@@ -281,16 +443,7 @@ class OllamaUI:
         zone.pack(fill='x', padx=UIStyles.SPACE_2XL, pady=UIStyles.SPACE_LG)
         
         # Header
-        header = ctk.CTkFrame(zone, fg_color="transparent")
-        header.pack(fill='x', padx=UIStyles.SPACE_2XL, pady=(UIStyles.SPACE_2XL, UIStyles.SPACE_MD))
-        
-        title = ctk.CTkLabel(
-            header,
-            text="Download Progress",
-            font=UIStyles.FONT_TITLE,
-            text_color=UIStyles.TEXT_PRIMARY
-        )
-        title.pack(side='left')
+        self._create_zone_header(zone, "Download Progress")
         
         # Progress display
         progress_frame = ctk.CTkFrame(zone, fg_color="transparent")
@@ -317,129 +470,120 @@ class OllamaUI:
     
     def _create_model_management_zone(self, parent):
         """Create model management zone."""
+        SM, MD, LG, XXL, FONT_NORMAL, TEXT_PRIMARY, TEXT_SECONDARY, PRIMARY_COLOR, SECONDARY_COLOR, SURFACE_COLOR = (
+            UIStyles.SPACE_SM, UIStyles.SPACE_MD, UIStyles.SPACE_LG,
+            UIStyles.SPACE_2XL, UIStyles.FONT_NORMAL, UIStyles.TEXT_PRIMARY,
+            UIStyles.TEXT_SECONDARY, UIStyles.PRIMARY_COLOR,
+            UIStyles.SECONDARY_COLOR, UIStyles.SURFACE_COLOR
+        )
         zone = UIStyles.create_card_frame(parent)
-        zone.pack(fill='x', padx=UIStyles.SPACE_2XL, pady=UIStyles.SPACE_LG)
         
         # Header
-        header = ctk.CTkFrame(zone, fg_color="transparent")
-        header.pack(fill='x', padx=UIStyles.SPACE_2XL, pady=(UIStyles.SPACE_2XL, UIStyles.SPACE_MD))
-        
-        title = ctk.CTkLabel(
-            header,
-            text="Model Management",
-            font=UIStyles.FONT_TITLE,
-            text_color=UIStyles.TEXT_PRIMARY
-        )
-        title.pack(side='left')
+        header = self._create_zone_header(zone, "Model Management", row=True)
     
         # Active model indicator in setup
         current_model = self.status_manager.get_active_model()
         model_text = current_model if current_model else "None"
+        self.setup_active_model_var.set(f" (Active: {model_text})")
         
         self.setup_active_model_label = ctk.CTkLabel(
             header,
-            text=f" (Active: {model_text})",
-            font=UIStyles.FONT_NORMAL,
-            text_color=UIStyles.PRIMARY_COLOR
+            textvariable=self.setup_active_model_var,
+            font=FONT_NORMAL,
+            text_color=PRIMARY_COLOR
         )
-        self.setup_active_model_label.pack(side='left', padx=(UIStyles.SPACE_SM, 0))
+        self.setup_active_model_label.pack(side='left', padx=(SM, 0))
         
-        # Download section
+        # Download section: label above, input and button gridded below it
         download_section = ctk.CTkFrame(zone, fg_color="transparent")
-        download_section.pack(fill='x', padx=UIStyles.SPACE_2XL, pady=(0, UIStyles.SPACE_LG))
+        download_section.pack(fill='x', padx=XXL, pady=(0, LG))
+        download_section.grid_columnconfigure(0, weight=1)
         
         # Input
         input_label = ctk.CTkLabel(
             download_section,
             text="Model Name (e.g., llama2, mistral):",
-            font=UIStyles.FONT_NORMAL,
-            text_color=UIStyles.TEXT_SECONDARY
+            font=FONT_NORMAL,
+            text_color=TEXT_SECONDARY
         )
-        input_label.pack(anchor='w', pady=(0, UIStyles.SPACE_SM))
-        
-        # Input and Download Button Row
-        input_row = ctk.CTkFrame(download_section, fg_color="transparent")
-        input_row.pack(fill='x', pady=(0, UIStyles.SPACE_MD))
+        input_label.grid(row=0, column=0, columnspan=2, sticky='w', pady=(0, SM))
         
         self.model_input = UIStyles.create_input_field(
-            input_row,
+            download_section,
             placeholder_text="Enter model name from Ollama repository..."
         )
-        self.model_input.pack(side='left', fill='x', expand=True, padx=(0, UIStyles.SPACE_MD))
+        self.model_input.grid(row=1, column=0, sticky='ew', padx=(0, MD), pady=(0, MD))
         
         self.download_model_btn = UIStyles.create_button(
-            input_row,
+            download_section,
             text="Download Model",
             command=self._on_download_model_click,
             width=140
         )
-        self.download_model_btn.pack(side='right')
+        self.download_model_btn.grid(row=1, column=1, sticky='e', pady=(0, MD))
         
         # Model list section
         list_section = ctk.CTkFrame(zone, fg_color="transparent")
-        list_section.pack(fill='x', padx=UIStyles.SPACE_2XL, pady=(0, UIStyles.SPACE_2XL))
+        list_section.pack(fill='x', padx=XXL, pady=(0, XXL))
         
         list_label = ctk.CTkLabel(
             list_section,
             text="Available Models:",
-            font=UIStyles.FONT_NORMAL,
-            text_color=UIStyles.TEXT_SECONDARY
+            font=FONT_NORMAL,
+            text_color=TEXT_SECONDARY
         )
-        list_label.pack(anchor='w', pady=(UIStyles.SPACE_LG, UIStyles.SPACE_SM))
-        
-        # Model controls
-        control_frame = ctk.CTkFrame(list_section, fg_color="transparent")
-        control_frame.pack(fill='x')
+        list_label.grid(row=0, column=0, columnspan=3, sticky='w', pady=(LG, SM))
         
+        # Model controls, gridded in the row below the label
         self.model_dropdown = ctk.CTkComboBox(
-            control_frame,
+            list_section,
             values=[],
             command=self._on_model_select,
             width=280,
             height=34,
-            fg_color=UIStyles.SURFACE_COLOR,
-            button_color=UIStyles.SECONDARY_COLOR,
+            fg_color=SURFACE_COLOR,
+            button_color=SECONDARY_COLOR,
             button_hover_color=UIStyles.HOVER_COLOR,
-            dropdown_fg_color=UIStyles.SURFACE_COLOR,
-            text_color=UIStyles.TEXT_SECONDARY # Start with muted text for placeholder
+            dropdown_fg_color=SURFACE_COLOR,
+            text_color=TEXT_SECONDARY # Start with muted text for placeholder
         )
         self.model_dropdown.set("empty")
-        self.model_dropdown.pack(side='left', padx=(0, UIStyles.SPACE_MD))
+        self.model_dropdown.grid(row=1, column=0, sticky='w', padx=(0, MD))
         
         self.activate_model_btn = UIStyles.create_button(
-            control_frame,
+            list_section,
             text="Activate",
             command=self._on_activate_model_click,
             state="disabled",
             width=110
         )
-        self.activate_model_btn.pack(side='left', padx=(0, UIStyles.SPACE_MD))
+        self.activate_model_btn.grid(row=1, column=1, sticky='w', padx=(0, MD))
         
         self.delete_model_btn = UIStyles.create_secondary_button(
-            control_frame,
+            list_section,
             text="Delete",
             command=self._on_delete_model_click,
             state="disabled",
             width=110,
-            fg_color=UIStyles.SECONDARY_COLOR,
+            fg_color=SECONDARY_COLOR,
             hover_color=UIStyles.ERROR_COLOR
         )
-        self.delete_model_btn.pack(side='left')
+        self.delete_model_btn.grid(row=1, column=2, sticky='w')
         
         # Progress Section (Hidden by default)
         self.model_progress_frame = ctk.CTkFrame(zone, fg_color="transparent")
-        self.model_progress_frame.pack(fill='x', padx=UIStyles.SPACE_2XL, pady=(0, UIStyles.SPACE_2XL))
+        self.model_progress_frame.pack(fill='x', padx=XXL, pady=(0, XXL))
         self.model_progress_frame.pack_forget() # Hide initially
 
         progress_header = ctk.CTkFrame(self.model_progress_frame, fg_color="transparent")
         progress_header.pack(fill='x', pady=(0, 5))
         
-        self.model_progress_title = ctk.CTkLabel(progress_header, text="Downloading Model...", font=UIStyles.FONT_NORMAL, text_color=UIStyles.TEXT_SECONDARY)
+        self.model_progress_title = ctk.CTkLabel(progress_header, text="Downloading Model...", font=FONT_NORMAL, text_color=TEXT_SECONDARY)
         self.model_progress_title.pack(side='left')
-        self.model_progress_label = ctk.CTkLabel(progress_header, text="0%", font=UIStyles.FONT_NORMAL, text_color=UIStyles.TEXT_PRIMARY)
+        self.model_progress_label = ctk.CTkLabel(progress_header, textvariable=self.model_progress_var, font=FONT_NORMAL, text_color=TEXT_PRIMARY)
         self.model_progress_label.pack(side='right')
 
-        self.model_progress_bar = ctk.CTkProgressBar(self.model_progress_frame, height=10, progress_color=UIStyles.PRIMARY_COLOR)
+        self.model_progress_bar = ctk.CTkProgressBar(self.model_progress_frame, height=10, progress_color=PRIMARY_COLOR)
         self.model_progress_bar.pack(fill='x')
         self.model_progress_bar.set(0)
 
@@ -447,68 +591,65 @@ class OllamaUI:
         if self.status_manager.get_ollama_status() == "Running":
             self._refresh_model_list()
 
+        # Pack the finished card
+        zone.pack(fill='x', padx=XXL, pady=LG)
+
         return zone
     
     def _create_system_info_zone(self, parent):
         """Create system information zone."""
+        SM, MD, XXL, FONT_NORMAL, TEXT_PRIMARY, TEXT_SECONDARY = (
+            UIStyles.SPACE_SM, UIStyles.SPACE_MD, UIStyles.SPACE_2XL,
+            UIStyles.FONT_NORMAL, UIStyles.TEXT_PRIMARY, UIStyles.TEXT_SECONDARY
+        )
         zone = UIStyles.create_card_frame(parent)
-        zone.pack(fill='x', padx=UIStyles.SPACE_2XL, pady=UIStyles.SPACE_LG)
         
         # Header
-        header = ctk.CTkFrame(zone, fg_color="transparent")
-        header.pack(fill='x', padx=UIStyles.SPACE_2XL, pady=(UIStyles.SPACE_2XL, UIStyles.SPACE_MD))
-        
-        title = ctk.CTkLabel(
-            header,
-            text="System Information",
-            font=UIStyles.FONT_TITLE,
-            text_color=UIStyles.TEXT_PRIMARY
-        )
-        title.pack(side='left')
+        self._create_zone_header(zone, "System Information")
         
         # Info content
         content = ctk.CTkFrame(zone, fg_color="transparent")
-        content.pack(fill='x', padx=UIStyles.SPACE_2XL, pady=(0, UIStyles.SPACE_2XL))
+        content.pack(fill='x', padx=XXL, pady=(0, XXL))
         
         # Installation path
         path_frame = ctk.CTkFrame(content, fg_color="transparent")
-        path_frame.pack(fill='x', pady=(0, UIStyles.SPACE_SM))
+        path_frame.pack(fill='x', pady=(0, SM))
         
         path_label = ctk.CTkLabel(
             path_frame,
             text="Installation Path:",
-            font=UIStyles.FONT_NORMAL,
-            text_color=UIStyles.TEXT_SECONDARY
+            font=FONT_NORMAL,
+            text_color=TEXT_SECONDARY
         )
         path_label.pack(side='left')
         
         self.install_path_label = ctk.CTkLabel(
             path_frame,
             text="Not installed",
-            font=UIStyles.FONT_NORMAL,
-            text_color=UIStyles.TEXT_PRIMARY
+            font=FONT_NORMAL,
+            text_color=TEXT_PRIMARY
         )
-        self.install_path_label.pack(side='left', padx=(UIStyles.SPACE_MD, 0))
+        self.install_path_label.pack(side='left', padx=(MD, 0))
         
         # Storage usage
         storage_frame = ctk.CTkFrame(content, fg_color="transparent")
-        storage_frame.pack(fill='x', pady=(0, UIStyles.SPACE_SM))
+        storage_frame.pack(fill='x', pady=(0, SM))
         
         storage_label = ctk.CTkLabel(
             storage_frame,
             text="Storage Usage:",
-            font=UIStyles.FONT_NORMAL,
-            text_color=UIStyles.TEXT_SECONDARY
+            font=FONT_NORMAL,
+            text_color=TEXT_SECONDARY
         )
         storage_label.pack(side='left')
         
         self.storage_label = ctk.CTkLabel(
             storage_frame,
             text="0 MB",
-            font=UIStyles.FONT_NORMAL,
-            text_color=UIStyles.TEXT_PRIMARY
+            font=FONT_NORMAL,
+            text_color=TEXT_PRIMARY
         )
-        self.storage_label.pack(side='left', padx=(UIStyles.SPACE_MD, 0))
+        self.storage_label.pack(side='left', padx=(MD, 0))
         
         # Last update
         update_frame = ctk.CTkFrame(content, fg_color="transparent")
@@ -517,74 +658,79 @@ class OllamaUI:
         update_label = ctk.CTkLabel(
             update_frame,
             text="Last Update:",
-            font=UIStyles.FONT_NORMAL,
-            text_color=UIStyles.TEXT_SECONDARY
+            font=FONT_NORMAL,
+            text_color=TEXT_SECONDARY
         )
         update_label.pack(side='left')
         
         self.update_label = ctk.CTkLabel(
             update_frame,
             text="Never",
-            font=UIStyles.FONT_NORMAL,
-            text_color=UIStyles.TEXT_PRIMARY
+            font=FONT_NORMAL,
+            text_color=TEXT_PRIMARY
         )
-        self.update_label.pack(side='left', padx=(UIStyles.SPACE_MD, 0))
+        self.update_label.pack(side='left', padx=(MD, 0))
         
+        # Pack the finished card
+        zone.pack(fill='x', padx=XXL, pady=UIStyles.SPACE_LG)
+
         return zone
     
     # Event handlers
     def _on_ollama_status_change(self, new_status: str, old_status: str):
         """Handle Ollama status changes."""
-        # Update status text and colors
-        # Update status indicator color
-        color_map = {
-            "Stopped": "#94a3b8", # Neutral grey-blue
-            "Not Installed": "#ef4444",
-            "Starting": "#f59e0b",
-            "Running": "#10b981",
-            "Error": "#ef4444",
-            "Downloading": "#3b82f6",
-            "Installing": "#8b5cf6"
-        }
-        
-        color = color_map.get(new_status, "#f59e0b")
-        
-        # Safely update UI using after()
-        def safe_update():
-            # Check if parent is still valid and has 'after'
-            if not hasattr(self.parent, 'after'):
-                return
+        # Keep only the latest status; a burst of transitions is applied in
+        # a single UI pass on the next idle tick
+        self._pending_status = new_status
+        if not self._status_update_scheduled:
+            self._status_update_scheduled = True
             try:
-                if hasattr(self, 'status_label') and self.status_label:
-                    self.status_label.configure(text=new_status)
-                if hasattr(self, 'ai_status_label') and self.ai_status_label:
-                    self.ai_status_label.configure(text=f"Status: {new_status}")
-                if hasattr(self, 'status_indicator') and self.status_indicator:
-                    self.status_indicator.configure(text_color=color)
-                self._update_button_states(new_status)
+                self.parent.after_idle(self._flush_status_update)
             except Exception:
-                pass # UI may be closing or not in main loop yet
-
-        try:
-            self.parent.after(0, safe_update)
-        except Exception:
-            pass # Handle "main thread not in main loop" or similar init errors
+                # Handle "main thread not in main loop" or similar init errors
+                self._status_update_scheduled = False
         
         # Refresh model list if service just started running
         if new_status == "Running":
             self.parent.after(500, self._refresh_model_list)
+
+    def _flush_status_update(self):
+        """Apply the latest pending Ollama status to the UI."""
+        self._status_update_scheduled = False
+        new_status = self._pending_status
+
+        # Update status indicator color
+        color = self.STATUS_COLORS.get(new_status, "#f59e0b")
+        
+        try:
+            self.status_var.set(new_status)
+            self.ai_status_var.set(f"Status: {new_status}")
+            if self.status_indicator is not None:
+                self.status_indicator.configure(text_color=color)
+            self._update_button_states(new_status)
+        except Exception:
+            # UI may be closing
+            self.logger.debug("Ollama status UI update skipped", exc_info=True)
     
-    def _on_active_model_change(self, new_model: Optional[str], old_model: Optional[str]):
-        """Handle active model changes."""
-        self.parent.after(0, lambda: self._handle_active_model_ui_update(new_model))
+    def _on_profile_state_change(self, *_args):
+        """
+        Handle active model, active character and character sync changes.
 
-    def _on_active_character_change(self, new_char: Optional[str], old_char: Optional[str]):
-        """Handle active character profile changes."""
-        self.parent.after(0, lambda: self._handle_active_character_ui_update(new_char))
+        Loading a profile changes all three at once; the labels are refreshed
+        from the status manager in one idle pass.
+        """
+        if self._profile_update_scheduled:
+            return
+        self._profile_update_scheduled = True
+        self.parent.after_idle(self._flush_profile_state)
 
-    def _on_character_sync_change(self, is_synced: bool, was_synced: bool):
-        """Handle character manifest sync status changes."""
-        self.parent.after(0, lambda: self._handle_character_sync_ui_update(is_synced))
+    def _flush_profile_state(self):
+        """Apply the current active model, character and sync state."""
+        self._profile_update_scheduled = False
+        sm = self.status_manager
+        self._handle_active_model_ui_update(sm.get_active_model())
+        self._handle_active_character_ui_update(sm.get_active_character())
+        self._handle_character_sync_ui_update(sm.is_character_synced())
 
     def _handle_character_sync_ui_update(self, is_synced: bool):
         active_model = self.status_manager.get_active_model()
@@ -595,121 +741,81 @@ class OllamaUI:
             text = "(Not Applied)"
             color = "#94a3b8" # Slate
         
-        if hasattr(self, 'char_sync_label') and self.char_sync_label:
+        if self.char_sync_label is not None:
             self.char_sync_label.configure(text=text, text_color=color)
         
-        if hasattr(self, 'setup_char_sync_label') and self.setup_char_sync_label:
+        if self.setup_char_sync_label is not None:
             self.setup_char_sync_label.configure(text=text, text_color=color)
 
     def _handle_active_character_ui_update(self, new_char):
-        char_text = new_char if new_char else "None"
-        if hasattr(self, 'active_char_label') and self.active_char_label:
-            self.active_char_label.configure(text=char_text)
+        self.active_char_var.set(new_char if new_char else "None")
 
     def _handle_active_model_ui_update(self, new_model):
         model_text = new_model if new_model else "None"
-        if hasattr(self, 'active_model_label') and self.active_model_label:
-            self.active_model_label.configure(text=model_text)
-        
-        if hasattr(self, 'setup_active_model_label') and self.setup_active_model_label:
-            self.setup_active_model_label.configure(text=f" (Active: {model_text})")
+        self.active_model_var.set(model_text)
+        self.setup_active_model_var.set(f" (Active: {model_text})")
         
         # Update dropdown selection
-        if new_model and hasattr(self, 'model_dropdown') and self.model_dropdown:
+        if new_model and self.model_dropdown is not None and self.model_dropdown.get() != new_model:
             self.model_dropdown.set(new_model)
     
     def _update_button_states(self, status: str):
         """Update button states based on Ollama status."""
-        # Dashboard buttons (if they exist)
-        if hasattr(self, 'start_btn'):
-            self.start_btn.configure(state="disabled")
-        if hasattr(self, 'stop_btn'):
-            self.stop_btn.configure(state="disabled")
-        if hasattr(self, 'restart_btn'):
-            self.restart_btn.configure(state="disabled")
-        if hasattr(self, 'delete_btn'):
-            self.delete_btn.configure(state="disabled")
-
-        if not hasattr(self, 'ai_service_btn') or not self.ai_service_btn:
-             return
-
-        ollama_installed = self.file_manager.ollama_exists()
-
-        if status == "Not Installed":
-            # If not installed, disable service button
-            self.ai_service_btn.configure(
-                state="disabled", 
-                text="ON", 
-                fg_color=UIStyles.SUCCESS_COLOR
-            )
-            self.ai_action_btn.configure(state="normal", text="Download Ollama")
-        elif status == "Stopped":
-            self.ai_service_btn.configure(
-                state="normal", 
-                text="ON", 
-                fg_color=UIStyles.SUCCESS_COLOR,
-                hover_color=UIStyles.PRIMARY_HOVER
-            )
-            self.ai_action_btn.configure(state="normal", text="Delete Ollama")
-        elif status == "Running":
-            self.ai_service_btn.configure(
-                state="normal", 
-                text="OFF", 
-                fg_color=UIStyles.SECONDARY_COLOR, 
-                hover_color=UIStyles.ERROR_COLOR
-            )
-            self.ai_action_btn.configure(state="normal", text="Delete Ollama")
-        elif status == "Checking":
-            self.ai_service_btn.configure(state="disabled", text="...")
-            self.ai_action_btn.configure(state="disabled")
-        elif status == "Downloading":
-            self.ai_service_btn.configure(state="disabled", text="ON")
-            self.ai_action_btn.configure(state="disabled", text="Downloading...")
-        elif status == "Installing":
-            self.ai_service_btn.configure(state="disabled", text="ON")
-            self.ai_action_btn.configure(state="disabled", text="Installing...")
-        elif status == "Starting":
-            self.ai_service_btn.configure(state="disabled", text="...")
-            self.ai_action_btn.configure(state="disabled", text="Delete Ollama")
-        elif status == "Stopping":
-            self.ai_service_btn.configure(state="disabled", text="...")
-            self.ai_action_btn.configure(state="disabled", text="Delete Ollama")
-        elif status == "Error":
-            self.ai_service_btn.configure(
-                state="normal" if ollama_installed else "disabled", 
-                text="ON", 
-                fg_color=UIStyles.SUCCESS_COLOR
-            )
-            if ollama_installed:
-                self.ai_action_btn.configure(state="normal", text="Delete Ollama")
+        if self.ai_service_btn is None:
+            return
+
+        if status == "Error":
+            # Whether the service can be retried depends on the binary
+            if self.file_manager.ollama_exists():
+                states = self.BUTTON_STATES["Error"]
             else:
-                self.ai_action_btn.configure(state="normal", text="Download Ollama")
-        else: # e.g. "Checking"
-            self.ai_service_btn.configure(state="disabled", text="Checking...")
-            self.ai_action_btn.configure(state="disabled")
+                states = self.BUTTON_STATES["Not Installed"]
+        else:
+            states = self.BUTTON_STATES.get(status, self.BUTTON_STATES_UNKNOWN)
+
+        # Repeated polls of the same status leave the buttons untouched
+        if states is self._button_states:
+            return
+        service_kw, action_kw = states
+        self.ai_service_btn.configure(**service_kw)
+        self.ai_action_btn.configure(**action_kw)
+        self._button_states = states
 
     def _refresh_model_list(self):
         """Fetch models from Ollama and update dropdown."""
-        if not hasattr(self, 'model_dropdown') or not self.model_dropdown:
+        if self.model_dropdown is None:
             return
 
-        def update():
-            try:
-                models = self.ollama_manager.list_models()
-                model_names = [m.get('name') for m in models if m.get('name')]
-                
-                if not model_names:
-                    model_names = ["empty"]
-                
-                self.parent.after(0, lambda: self._update_dropdown_items(model_names))
-            except Exception as e:
-                print(f"Error refreshing model list: {e}")
-
-        threading.Thread(target=update, daemon=True).start()
+        # A refresh already in flight will deliver the current model list
+        if self._refresh_running:
+            return
+        self._refresh_running = True
+        threading.Thread(target=self._fetch_model_names, daemon=True).start()
+
+    def _fetch_model_names(self):
+        """Worker: query installed models and hand them to the dropdown."""
+        try:
+            models = self.ollama_manager.list_models()
+            model_names = [m.get('name') for m in models if m.get('name')]
+            
+            if not model_names:
+                model_names = ["empty"]
+            
+            self.parent.after(0, self._update_dropdown_items, model_names)
+        except Exception:
+            self.logger.exception("Error refreshing model list")
+        finally:
+            self._refresh_running = False
 
     def _update_dropdown_items(self, model_names: list):
         """Update model dropdown items safely."""
-        if hasattr(self, 'model_dropdown') and self.model_dropdown:
+        if self.model_dropdown is not None:
+            # The installed models rarely change between refreshes; an
+            # identical list leaves the dropdown and its selection alone
+            names = tuple(model_names)
+            if names == self._model_names:
+                return
+            self._model_names = names
             self.model_dropdown.configure(values=model_names)
             
             # If current selection is not in list, set to first or empty
@@ -730,27 +836,28 @@ class OllamaUI:
         """Handle start/stop service toggle."""
         status = self.status_manager.get_ollama_status()
         
-        # Immediate visual feedback
+        # Immediate visual feedback; the next status must repaint the buttons
         self.ai_service_btn.configure(state="disabled", text="...")
+        self._button_states = None
         
         if status == "Running":
-            threading.Thread(target=self.ollama_manager.stop_service).start()
+            threading.Thread(target=self.ollama_manager.stop_service, daemon=True).start()
         else:
-            threading.Thread(target=self.ollama_manager.start_service).start()
+            threading.Thread(target=self.ollama_manager.start_service, daemon=True).start()
 
     def _on_action_click(self):
         """Handle download/delete action click."""
         if self.file_manager.ollama_exists():
             # Delete logic
             if messagebox.askyesno("Delete Ollama", "Are you sure you want to delete Ollama and all models?"):
-                threading.Thread(target=self.ollama_manager.delete_ollama).start()
+                threading.Thread(target=self.ollama_manager.delete_ollama, daemon=True).start()
         else:
             # Download logic
             self._on_download_click()
 
     def _on_start_click(self):
         """Handle start button click (legacy/other)."""
-        threading.Thread(target=self.ollama_manager.start_service).start()
+        threading.Thread(target=self.ollama_manager.start_service, daemon=True).start()
     
     def _on_stop_click(self):
         """Handle stop button click (legacy/other)."""
@@ -758,72 +865,113 @@ class OllamaUI:
     
     def _on_restart_click(self):
         """Handle restart button click (legacy/other)."""
-        threading.Thread(target=self.ollama_manager.restart_service).start()
+        threading.Thread(target=self.ollama_manager.restart_service, daemon=True).start()
     
     def _on_download_click(self):
         """Handle download button click."""
         self.ollama_progress_frame.pack(fill='x', padx=UIStyles.SPACE_2XL, pady=(0, UIStyles.SPACE_2XL))
-        self.ollama_progress_bar.set(0)
-        self.ollama_progress_label.configure(text="0%")
+        self._pending_progress.pop('ollama', None)
+        self._apply_progress('ollama', 0, "0%")
         
         # Disable button during download
         self.ai_action_btn.configure(state="disabled", text="Downloading...")
+        self._button_states = None
         
         def progress_callback(current, total, status_text):
             if total > 0:
-                progress = current / total
-                size_info = f"{self.format_bytes(current)} / {self.format_bytes(total)}"
-                self.parent.after(0, lambda: self.ollama_progress_bar.set(progress))
-                self.parent.after(0, lambda: self.ollama_progress_label.configure(text=f"{int(progress * 100)}% ({size_info})"))
+                self._on_download_progress('ollama', current, total)
         
         def ollama_status_callback(new_status, old_status):
             if new_status == "Installing":
-                self.parent.after(0, lambda: self.ollama_progress_label.configure(text="Installing... (Extracting files)"))
-                self.parent.after(0, lambda: self.ollama_progress_bar.set(1.0))
+                # A throttled paint still pending must not overwrite the
+                # installing message with the last download percentage
+                self._pending_progress.pop('ollama', None)
+                self.parent.after(0, self._apply_progress, 'ollama', 1.0, "Installing... (Extracting files)")
         
         # Temporary subscribe to status changes
         self.status_manager.add_callback('ollama_status', ollama_status_callback)
 
         def complete_callback(success, error_message=None):
             self.status_manager.remove_callback('ollama_status', ollama_status_callback)
-            self.parent.after(2000, lambda: self.ollama_progress_frame.pack_forget())
+            self.parent.after(2000, self.ollama_progress_frame.pack_forget)
             # Re-enable button is now handled by _on_ollama_status_change
             
             if not success and error_message:
                 self.parent.after(0, lambda: tk.messagebox.showerror("Download Error", error_message))
 
-        threading.Thread(target=self.ollama_manager.download_ollama, args=(progress_callback, complete_callback)).start()
+        threading.Thread(target=self.ollama_manager.download_ollama, args=(progress_callback, complete_callback), daemon=True).start()
     
     def _on_delete_click(self):
         """Handle delete button click (legacy/other)."""
-        threading.Thread(target=self.ollama_manager.delete_ollama).start()
+        threading.Thread(target=self.ollama_manager.delete_ollama, daemon=True).start()
     
     def _on_download_model_click(self):
         """Handle model download button click."""
-        if hasattr(self, 'model_input') and self.model_input:
+        if self.model_input is not None:
             model_name = self.model_input.get().strip()
             if model_name:
                 self.model_progress_frame.pack(fill='x', padx=UIStyles.SPACE_2XL, pady=(0, UIStyles.SPACE_2XL))
-                self.model_progress_bar.set(0)
-                self.model_progress_label.configure(text="0%")
+                self._pending_progress.pop('model', None)
+                self._apply_progress('model', 0, "0%")
                 self.model_progress_title.configure(text=f"Downloading {model_name}...")
 
                 def progress_callback(status, total, completed):
                     if total > 0:
-                        progress = completed / total
-                        size_info = f"{self.format_bytes(completed)} / {self.format_bytes(total)}"
-                        self.parent.after(0, lambda: self.model_progress_bar.set(progress))
-                        self.parent.after(0, lambda: self.model_progress_label.configure(text=f"{int(progress * 100)}% ({size_info})"))
+                        self._on_download_progress('model', completed, total)
 
                 def complete_callback(success, error_message=None):
-                    self.parent.after(2000, lambda: self.model_progress_frame.pack_forget())
+                    self.parent.after(2000, self.model_progress_frame.pack_forget)
                     if success:
                         self.parent.after(0, self._refresh_model_list)
                     elif error_message:
                         self.parent.after(0, lambda: tk.messagebox.showerror("Download Error", error_message))
 
-                threading.Thread(target=self.ollama_manager.download_model, args=(model_name, progress_callback, complete_callback)).start()
+                threading.Thread(target=self.ollama_manager.download_model, args=(model_name, progress_callback, complete_callback), daemon=True).start()
     
+    def _on_download_progress(self, kind, current, total):
+        """
+        Record download progress from a download thread.
+
+        Progress can arrive far faster than the screen refreshes, so only the
+        latest value per download kind is kept and painted at most once per
+        _PROGRESS_INTERVAL.
+
+        Args:
+            kind (str): PROGRESS_WIDGETS key of the download.
+            current (int): Bytes downloaded so far.
+            total (int): Total bytes.
+        """
+        self._pending_progress[kind] = (current, total)
+        if self._progress_scheduled:
+            return
+        self._progress_scheduled = True
+        wait = self._last_progress_paint + _PROGRESS_INTERVAL - time.monotonic()
+        self.parent.after(max(0, int(wait * 1000)), self._flush_download_progress)
+
+    def _flush_download_progress(self):
+        """Paint the latest progress of every running download."""
+        # Cleared before reading, so progress recorded during the paint
+        # schedules another one
+        self._progress_scheduled = False
+        self._last_progress_paint = time.monotonic()
+        for kind, (current, total) in list(self._pending_progress.items()):
+            progress = current / total
+            size_info = f"{self.format_bytes(current)} / {self.format_bytes(total)}"
+            self._apply_progress(kind, progress, f"{int(progress * 100)}% ({size_info})")
+
+    def _apply_progress(self, kind, progress, text):
+        """
+        Set a download's progress bar and text in one pass.
+
+        Args:
+            kind (str): PROGRESS_WIDGETS key of the download.
+            progress (float): Fraction done, 0.0 to 1.0.
+            text (str): Text for the progress label.
+        """
+        bar_attr, var_attr = self.PROGRESS_WIDGETS[kind]
+        getattr(self, bar_attr).set(progress)
+        getattr(self, var_attr).set(text)
+
     def _on_model_select(self, model_name: str):
         """Handle model selection from dropdown."""
         # Restore normal text color if not empty
@@ -832,9 +980,9 @@ class OllamaUI:
         else:
             self.model_dropdown.configure(text_color=UIStyles.TEXT_SECONDARY)
 
-        if hasattr(self, 'activate_model_btn') and self.activate_model_btn:
+        if self.activate_model_btn is not None:
             self.activate_model_btn.configure(state="normal" if model_name != "empty" else "disabled")
-        if hasattr(self, 'delete_model_btn') and self.delete_model_btn:
+        if self.delete_model_btn is not None:
             self.delete_model_btn.configure(
                 state="normal" if model_name != "empty" else "disabled",
                 fg_color=UIStyles.SECONDARY_COLOR,
@@ -843,7 +991,7 @@ class OllamaUI:
     
     def _on_activate_model_click(self):
         """Handle activate model button click."""
-        if hasattr(self, 'model_dropdown') and self.model_dropdown:
+        if self.model_dropdown is not None:
             model_name = self.model_dropdown.get()
             if model_name and model_name != "empty":
                 success = self.ollama_manager.activate_model(model_name)
@@ -854,7 +1002,7 @@ class OllamaUI:
     
     def _on_delete_model_click(self):
         """Handle delete model button click."""
-        if hasattr(self, 'model_dropdown') and self.model_dropdown:
+        if self.model_dropdown is not None:
             model_name = self.model_dropdown.get()
             if model_name and model_name != "empty":
                 if messagebox.askyesno("Delete Model", f"Are you sure you want to delete model '{model_name}'?"):
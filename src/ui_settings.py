@@ -34,7 +34,7 @@ class SettingsMixin:
 
         self.autonomous_var.set(self.bot.autonomous_mode)
         self.hiwaifu_language_var.set(self.bot.ocr_language)
-        self.use_translation_var.set(getattr(self.bot, 'use_translation_layer', False))
+        self.use_translation_var.set(self.bot.use_translation_layer)
         
         # Sync active model to StatusManager
         active_model = getattr(self.bot, 'active_model', None)
@@ -37,8 +37,13 @@ class UIUtilsMixin:
         _animate_scanning_dots: Animate dots for scanning status.
         _update_title_with_scanning: Update title with scanning info.
         show_temp_message: Show temporary message window.
+        _flush_log: Write buffered log lines in one insert.
+        _append_log: Append text to the log area, trimming old lines.
     """
 
+    # Oldest lines are dropped once the log area grows past this
+    LOG_MAX_LINES = 2000
+
     def log_message(self, message, internal=False):
         """
         Log a message to the UI log text area.
@@ -52,11 +57,39 @@ class UIUtilsMixin:
         if not hasattr(self, 'log_text') or not self.log_text:
             return  # UI not ready yet
         timestamp = time.strftime("%H:%M:%S")
-        self.log_text.configure(state=tk.NORMAL)
         prefix = "[i] " if internal else ""
-        self.log_text.insert(tk.END, f"[{timestamp}] {prefix}{message}\n")
-        self.log_text.yview(tk.END)
-        self.log_text.configure(state=tk.DISABLED)
+        self._log_buf.append(f"[{timestamp}] {prefix}{message}\n")
+        # Lines logged in the same event cycle are written with one insert
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.root.after_idle(self._flush_log)
+
+    def _flush_log(self):
+        """
+        Write all buffered log lines to the log area at once.
+        """
+        self._log_flush_scheduled = False
+        if not self._log_buf:
+            return
+        text = ''.join(self._log_buf)
+        self._log_buf.clear()
+        self._append_log(text)
+
+    def _append_log(self, text):
+        """
+        Append text to the log area, keeping at most LOG_MAX_LINES lines.
+
+        Args:
+            text (str): Text to insert at the end of the log.
+        """
+        log_text = self.log_text
+        log_text.configure(state=tk.NORMAL)
+        log_text.insert(tk.END, text)
+        lines = int(log_text.index('end-1c').split('.')[0])
+        if lines > self.LOG_MAX_LINES:
+            log_text.delete('1.0', f'{lines - self.LOG_MAX_LINES}.0')
+        log_text.yview(tk.END)
+        log_text.configure(state=tk.DISABLED)
 
     def clear_log_history(self):
         """
@@ -64,6 +97,7 @@ class UIUtilsMixin:
 
         Removes all text from the log display area.
         """
+        self._log_buf.clear()
         self.log_text.configure(state=tk.NORMAL)
         self.log_text.delete('1.0', tk.END)
         self.log_text.configure(state=tk.DISABLED)
@@ -90,7 +124,7 @@ class UIUtilsMixin:
         Removes the selected nickname from the listbox and underlying bot data.
 
         Args:
-            listbox: Tkinter Listbox widget.
+            listbox: Nick list widget (VirtualListbox).
             list_type (str): Type of list ("ignore" or "target").
         """
         selected_index = listbox.curselection()
@@ -107,6 +141,8 @@ class UIUtilsMixin:
         Populates the ignore, target, and suggested nick listboxes with
         current data from the bot, sorted alphabetically.
         """
+        if not self._nicks_built:
+            return  # Filled when the nicks section is first expanded
         self.ignore_listbox.delete(0, tk.END)
         for nick in sorted(list(self.bot.ignore_nicks)):
             self.ignore_listbox.insert(tk.END, nick)
@@ -124,6 +160,8 @@ class UIUtilsMixin:
         Args:
             nicks (list): List of suggested nicknames.
         """
+        if not self._nicks_built:
+            return
         self.suggested_listbox.delete(0, tk.END)
         for nick in sorted(nicks):
             self.suggested_listbox.insert(tk.END, nick)
@@ -0,0 +1,164 @@
+"""
+UI Widgets Module.
+
+This module provides lightweight custom Tk widgets used by the chatbot UI
+where the stock widgets scale poorly.
+
+Classes:
+    VirtualListbox: Canvas-backed list that only draws the visible rows.
+"""
+
+import tkinter as tk
+import tkinter.font as tkfont
+
+
+class VirtualListbox(tk.Canvas):
+    """
+    Canvas-backed replacement for tk.Listbox that draws only visible rows.
+
+    Supports the subset of the Listbox API used by the nick lists (insert,
+    delete, get, size, curselection), so drawing cost depends on the widget
+    height rather than on the number of items.
+
+    Attributes:
+        items: List of item strings.
+
+    Methods:
+        insert: Insert items at an index or at the end.
+        delete: Delete one item or a range of items.
+        get: Return the item at an index.
+        size: Return the number of items.
+        curselection: Return the selected index as a tuple.
+        _schedule_redraw: Coalesce redraws to the next idle tick.
+        _redraw: Draw the visible slice of items.
+        _clear_rows: Remove all drawn canvas items.
+        _scroll: Scroll by a number of rows.
+        _on_wheel: Handle mouse wheel scrolling.
+        _on_click: Select the clicked row.
+    """
+
+    def __init__(self, master, height=5, font=None, fg="black", bg="white",
+                 selectbackground="#3470d6", selectforeground=None, **kwargs):
+        """
+        Initialize the list.
+
+        Args:
+            master: Parent widget.
+            height (int): Number of rows requested for the widget height.
+            font: Font description used for the rows.
+            fg (str): Text color.
+            bg (str): Background color.
+            selectbackground (str): Background color of the selected row.
+            selectforeground (str): Text color of the selected row.
+            **kwargs: Extra options passed to tk.Canvas.
+        """
+        self._font = tkfont.Font(root=master, font=font) if font else tkfont.nametofont('TkDefaultFont')
+        self._row_h = self._font.metrics('linespace') + 2
+        kwargs.setdefault('highlightthickness', 0)
+        super().__init__(master, height=height * self._row_h, bg=bg, **kwargs)
+
+        self.items = []
+        self._fg = fg
+        self._select_bg = selectbackground
+        self._select_fg = selectforeground or fg
+        self._top = 0  # Index of the first visible row
+        self._selected = None
+        self._redraw_pending = False
+
+        self.bind('<Configure>', lambda event: self._schedule_redraw())
+        self.bind('<MouseWheel>', self._on_wheel)
+        self.bind('<Button-4>', lambda event: self._scroll(-1))
+        self.bind('<Button-5>', lambda event: self._scroll(1))
+        self.bind('<Button-1>', self._on_click)
+
+    def _index(self, index):
+        """Convert a Listbox-style index (int or END) to a list position."""
+        if index == tk.END:
+            return len(self.items)
+        return int(index)
+
+    def insert(self, index, *elements):
+        """
+        Insert items before the given index.
+
+        Args:
+            index: Position to insert at, or tk.END.
+            *elements: Item strings to insert.
+        """
+        pos = self._index(index)
+        self.items[pos:pos] = elements
+        self._schedule_redraw()
+
+    def delete(self, first, last=None):
+        """
+        Delete one item or the inclusive range first..last.
+
+        Args:
+            first: Index of the first item to delete.
+            last: Index of the last item to delete, or tk.END.
+        """
+        start = self._index(first)
+        end = start if last is None else min(self._index(last), len(self.items) - 1)
+        del self.items[start:end + 1]
+        self._selected = None
+        self._scroll(0)
+
+    def get(self, index):
+        """Return the item at the given index."""
+        return self.items[self._index(index)]
+
+    def size(self):
+        """Return the number of items."""
+        return len(self.items)
+
+    def curselection(self):
+        """Return the selected index as a tuple, empty if nothing is selected."""
+        return () if self._selected is None else (self._selected,)
+
+    def _visible_rows(self):
+        return max(1, self.winfo_height() // self._row_h + 1)
+
+    def _schedule_redraw(self):
+        """Coalesce several changes in one event cycle into a single redraw."""
+        if self._redraw_pending:
+            return
+        self._redraw_pending = True
+        self.after_idle(self._redraw)
+
+    def _redraw(self):
+        """Draw only the rows that fit in the widget."""
+        self._redraw_pending = False
+        self._clear_rows()
+        width = self.winfo_width()
+        row_h = self._row_h
+        end = min(len(self.items), self._top + self._visible_rows())
+        for i in range(self._top, end):
+            y = (i - self._top) * row_h
+            fill = self._fg
+            if i == self._selected:
+                self.create_rectangle(0, y, width, y + row_h, fill=self._select_bg, width=0)
+                fill = self._select_fg
+            self.create_text(4, y + 1, anchor='nw', text=self.items[i], font=self._font, fill=fill)
+
+    def _clear_rows(self):
+        """Remove all drawn canvas items (delete() is the Listbox API here)."""
+        tk.Canvas.delete(self, 'all')
+
+    def _scroll(self, rows):
+        """
+        Scroll by a number of rows, clamped to the item range.
+
+        Args:
+            rows (int): Rows to scroll; negative scrolls up.
+        """
+        max_top = max(0, len(self.items) - self._visible_rows() + 1)
+        self._top = max(0, min(self._top + rows, max_top))
+        self._schedule_redraw()
+
+    def _on_wheel(self, event):
+        self._scroll(-1 if event.delta > 0 else 1)
+
+    def _on_click(self, event):
+        index = self._top + event.y // self._row_h
+        self._selected = index if index < len(self.items) else None
+        self._schedule_redraw()
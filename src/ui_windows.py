@@ -250,7 +250,8 @@ class UIWindowsMixin:
         # Also sync the variable if it wasn't already
         self.show_zones_var.set(self.bot.show_overlay)
         
-        UIStyles.create_secondary_button(zones_buttons, text=overlay_text, command=self.on_toggle_overlay, width=150, height=40).pack(side=tk.LEFT)
+        self._game_sync_overlay_btn = UIStyles.create_secondary_button(zones_buttons, text=overlay_text, command=self.on_toggle_overlay, width=150, height=40)
+        self._game_sync_overlay_btn.pack(side=tk.LEFT)
 
         # Save button
         save_frame = ctk.CTkFrame(self.game_sync_frame, fg_color="transparent")